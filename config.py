@@ -5,17 +5,39 @@ Centralized configuration management
 """
 
 import os
-from dataclasses import dataclass
-from typing import Dict, List
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 
-@dataclass
+# Live view of the process environment, bound once for the env readers below
+_ENV = os.environ
+
+# Separator for comma-separated list variables, absorbing surrounding whitespace
+_LIST_SEPARATOR = re.compile(r'\s*,\s*')
+
+# Output directory most recently created by validate_config
+_last_ensured_dir = None
+
+
+# Default browser user agents, shared by every ScrapingConfig
+_DEFAULT_USER_AGENTS = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0'
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ScrapingConfig:
     """Configuration class for scraping parameters"""
 
     # Rate limiting settings
-    min_delay: float = 1.0  # Minimum delay between requests (seconds)
-    max_delay: float = 3.0  # Maximum delay between requests (seconds)
+    min_delay: float = 3.0  # Minimum delay between requests (seconds)
+    max_delay: float = 7.0  # Maximum delay between requests (seconds)
 
     # Request settings
     timeout: int = 30  # Request timeout (seconds)
@@ -38,54 +60,48 @@ class ScrapingConfig:
     log_file: str = "clutch_scraper.log"  # Log file name
     enable_console_logging: bool = True  # Enable console logging
 
+    # Development settings
+    http_cache_path: Optional[str] = None  # Shelve file caching fetched pages by URL (disabled if unset)
+
     # User agent rotation
-    user_agents: List[str] = None
+    user_agents: Tuple[str, ...] = field(default_factory=lambda: _DEFAULT_USER_AGENTS)
 
-    def __post_init__(self):
-        """Initialize default user agents if not provided"""
-        if self.user_agents is None:
-            self.user_agents = [
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0'
-            ]
-
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_directory):
-            os.makedirs(self.output_directory)
-
-
-@dataclass
+    def ensure_output_dir(self):
+        """Create the output directory if it doesn't exist"""
+        os.makedirs(self.output_directory, exist_ok=True)
+
+
+@dataclass(frozen=True, slots=True)
 class ScrapingTargets:
     """Configuration for what to scrape"""
 
     # Categories to scrape (empty means all)
-    target_categories: List[str] = None
+    target_categories: Tuple[str, ...] = field(default_factory=tuple)
 
     # Specific companies to target (optional)
-    target_companies: List[str] = None
+    target_companies: Tuple[str, ...] = field(default_factory=tuple)
 
     # Skip categories (if scraping all but want to exclude some)
-    skip_categories: List[str] = None
+    skip_categories: Tuple[str, ...] = field(default_factory=tuple)
 
-    def __post_init__(self):
-        """Initialize defaults"""
-        if self.target_categories is None:
-            self.target_categories = []
+    # Set views of the category lists, derived at construction
+    _target_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _skip_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
-        if self.target_companies is None:
-            self.target_companies = []
+    def __post_init__(self):
+        """Build the category set views"""
+        object.__setattr__(self, '_target_set', frozenset(self.target_categories))
+        object.__setattr__(self, '_skip_set', frozenset(self.skip_categories))
 
-        if self.skip_categories is None:
-            self.skip_categories = []
+    def should_scrape(self, category: str) -> bool:
+        """Check whether a category is targeted (or no targets are set) and not skipped"""
+        return (not self._target_set or category in self._target_set) and category not in self._skip_set
 
 
 # Development categories configuration with priority levels
 DEVELOPMENT_CATEGORIES_CONFIG = {
     # High priority - most common/valuable categories
-    'high_priority': [
+    'high_priority': (
         'Software Developers',
         'Web Developers',
         'Mobile Apps',
@@ -93,10 +109,10 @@ DEVELOPMENT_CATEGORIES_CONFIG = {
         'Python & Django',
         'React Native',
         'Artificial Intelligence'
-    ],
+    ),
 
     # Medium priority
-    'medium_priority': [
+    'medium_priority': (
         'App Developers',
         'PHP',
         'Java',
@@ -104,10 +120,10 @@ DEVELOPMENT_CATEGORIES_CONFIG = {
         'Wordpress',
         'Shopify',
         'Flutter'
-    ],
+    ),
 
     # Lower priority
-    'low_priority': [
+    'low_priority': (
         'Laravel',
         'Microsoft Sharepoint',
         'Webflow',
@@ -120,12 +136,12 @@ DEVELOPMENT_CATEGORIES_CONFIG = {
         'Magento',
         'BigCommerce',
         'WooCommerce'
-    ]
+    )
 }
 
 # Selectors configuration - adjust these based on actual site structure
 SELECTORS_CONFIG = {
-    'company_listing': [
+    'company_listing': (
         'div[class*="company"]',
         'div[class*="provider"]',
         'div[class*="listing"]',
@@ -134,103 +150,124 @@ SELECTORS_CONFIG = {
         '.search-result',
         '.company-tile',
         '.provider-card'
-    ],
+    ),
 
-    'company_name': [
+    'company_name': (
         'h2 a',
         'h3 a',
         'h4 a',
         '.company-name a',
         '.provider-name a',
         'a[href*="/profile/"]'
-    ],
+    ),
 
-    'reviews': [
+    'reviews': (
         'div[class*="review"]',
         'article[class*="review"]',
         'div[class*="testimonial"]',
         '.review-card',
         '.client-review'
-    ],
+    ),
 
-    'pagination': [
+    'pagination': (
         'nav[class*="pagination"]',
         '.pagination',
         '.pager',
         'div[class*="pagination"]'
-    ]
+    )
 }
 
+# HTTP status codes that are retried / skipped without retrying
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+SKIP_STATUS_CODES = frozenset({403, 404, 401})
+
 # Error handling configuration
 ERROR_HANDLING_CONFIG = {
     'max_consecutive_failures': 5,  # Stop category after N consecutive failures
     'max_total_failures': 20,  # Stop entire scraping after N total failures
-    'retry_on_status_codes': [429, 500, 502, 503, 504],  # HTTP codes to retry
-    'skip_on_status_codes': [403, 404, 401],  # HTTP codes to skip (don't retry)
+    'retry_on_status_codes': RETRY_STATUS_CODES,  # HTTP codes to retry
+    'skip_on_status_codes': SKIP_STATUS_CODES,  # HTTP codes to skip (don't retry)
     'backoff_multiplier': 2.0,  # Exponential backoff multiplier
     'max_backoff_delay': 60.0  # Maximum backoff delay (seconds)
 }
 
 
+# Environment variable -> (ScrapingConfig field, converter)
+_ENV_CONFIG_FIELDS = {
+    'SCRAPER_MIN_DELAY': ('min_delay', float),
+    'SCRAPER_MAX_DELAY': ('max_delay', float),
+    'SCRAPER_TIMEOUT': ('timeout', int),
+    'SCRAPER_MAX_RETRIES': ('max_retries', int),
+    'SCRAPER_MAX_PAGES': ('max_pages_per_category', int),
+    'SCRAPER_MAX_COMPANIES': ('max_companies_per_page', int),
+    'SCRAPER_OUTPUT_DIR': ('output_directory', str),
+    'SCRAPER_LOG_LEVEL': ('log_level', str),
+    'SCRAPER_LOG_FILE': ('log_file', str),
+    'SCRAPER_HTTP_CACHE': ('http_cache_path', str),
+}
+
+
+@lru_cache(maxsize=1)
 def get_config_from_env() -> ScrapingConfig:
-    """Create configuration from environment variables"""
-    config = ScrapingConfig()
+    """Create configuration from environment variables (built once per process)"""
+    # Override defaults with environment variables if they exist
+    overrides = {
+        field_name: convert(_ENV[env_key])
+        for env_key, (field_name, convert) in _ENV_CONFIG_FIELDS.items()
+        if env_key in _ENV
+    }
+
+    return ScrapingConfig(**overrides)
 
-    # Override with environment variables if they exist
-    config.min_delay = float(os.getenv('SCRAPER_MIN_DELAY', config.min_delay))
-    config.max_delay = float(os.getenv('SCRAPER_MAX_DELAY', config.max_delay))
-    config.timeout = int(os.getenv('SCRAPER_TIMEOUT', config.timeout))
-    config.max_retries = int(os.getenv('SCRAPER_MAX_RETRIES', config.max_retries))
-    config.max_pages_per_category = int(os.getenv('SCRAPER_MAX_PAGES', config.max_pages_per_category))
-    config.max_companies_per_page = int(os.getenv('SCRAPER_MAX_COMPANIES', config.max_companies_per_page))
-    config.output_directory = os.getenv('SCRAPER_OUTPUT_DIR', config.output_directory)
-    config.log_level = os.getenv('SCRAPER_LOG_LEVEL', config.log_level)
-    config.log_file = os.getenv('SCRAPER_LOG_FILE', config.log_file)
 
-    return config
+def _split_env_list(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated env value into a tuple of non-empty, trimmed items"""
+    return tuple(filter(None, _LIST_SEPARATOR.split(value.strip())))
 
 
+@lru_cache(maxsize=1)
 def get_targets_from_env() -> ScrapingTargets:
-    """Create targets configuration from environment variables"""
-    targets = ScrapingTargets()
+    """Create targets configuration from environment variables (built once per process)"""
+    overrides = {}
 
     # Parse comma-separated environment variables
-    target_cats = os.getenv('SCRAPER_TARGET_CATEGORIES', '')
+    target_cats = _ENV.get('SCRAPER_TARGET_CATEGORIES', '')
     if target_cats:
-        targets.target_categories = [cat.strip() for cat in target_cats.split(',')]
+        overrides['target_categories'] = _split_env_list(target_cats)
 
-    skip_cats = os.getenv('SCRAPER_SKIP_CATEGORIES', '')
+    skip_cats = _ENV.get('SCRAPER_SKIP_CATEGORIES', '')
     if skip_cats:
-        targets.skip_categories = [cat.strip() for cat in skip_cats.split(',')]
+        overrides['skip_categories'] = _split_env_list(skip_cats)
 
-    return targets
+    return ScrapingTargets(**overrides)
 
 
-def validate_config(config: ScrapingConfig) -> List[str]:
-    """Validate configuration and return list of errors"""
-    errors = []
-
-    if config.min_delay < 0:
-        errors.append("min_delay must be non-negative")
-
-    if config.max_delay < config.min_delay:
-        errors.append("max_delay must be >= min_delay")
+def invalidate_config_cache():
+    """Drop the cached env configuration so the next call re-reads the environment"""
+    get_config_from_env.cache_clear()
+    get_targets_from_env.cache_clear()
 
-    if config.timeout <= 0:
-        errors.append("timeout must be positive")
 
-    if config.max_retries < 0:
-        errors.append("max_retries must be non-negative")
+def validate_config(config: ScrapingConfig) -> List[str]:
+    """Validate configuration and return list of errors"""
+    global _last_ensured_dir
 
-    if config.max_pages_per_category <= 0:
-        errors.append("max_pages_per_category must be positive")
+    min_delay, max_delay = config.min_delay, config.max_delay
 
-    if config.max_companies_per_page <= 0:
-        errors.append("max_companies_per_page must be positive")
+    checks = (
+        (min_delay >= 0, "min_delay must be non-negative"),
+        (max_delay >= min_delay, "max_delay must be >= min_delay"),
+        (config.timeout > 0, "timeout must be positive"),
+        (config.max_retries >= 0, "max_retries must be non-negative"),
+        (config.max_pages_per_category > 0, "max_pages_per_category must be positive"),
+        (config.max_companies_per_page > 0, "max_companies_per_page must be positive"),
+    )
+    errors = [message for ok, message in checks if not ok]
 
-    if not os.path.exists(config.output_directory):
+    if config.output_directory != _last_ensured_dir:
         try:
-            os.makedirs(config.output_directory)
+            config.ensure_output_dir()
+            _last_ensured_dir = config.output_directory
         except OSError as e:
             errors.append(f"Cannot create output directory: {e}")
 
@@ -254,7 +291,8 @@ if __name__ == "__main__":
         print("Configuration is valid")
 
     print(f"Available categories by priority:")
+    lines = []
     for priority, categories in DEVELOPMENT_CATEGORIES_CONFIG.items():
-        print(f"  {priority}: {len(categories)} categories")
-        for cat in categories:
-            print(f"    - {cat}")
\ No newline at end of file
+        lines.append(f"  {priority}: {len(categories)} categories")
+        lines.extend(f"    - {cat}" for cat in categories)
+    print("\n".join(lines))
\ No newline at end of file
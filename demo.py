@@ -6,48 +6,57 @@ from main import ClutchScrapingManager
 from models import ScrapedData, CompetitorInfo, ReviewerInfo, ProjectInfo
 from exporter import AdvancedDataExporter
 
+SEP = "=" * 60
+
 def demo_data_models():
     
-    print("="*60)
-    print("DEMO: Data Models")
-    print("="*60)
-
     sample_data = ScrapedData(
         subcategory="Software Developers",
         competitor=CompetitorInfo(
             name="TechnoSoft Solutions",
             locations=["New York, NY", "London, UK"]
         ),
-        reviewer=ReviewerInfo(
-            name="John Smith",
-            job_title="Chief Technology Officer",
-            company="FinanceCorpXYZ",
-            industry="Financial Services",
-            location="Austin, TX",
-            company_size="100-200 employees"
-        ),
-        project=ProjectInfo(
-            service_provided="Custom Enterprise Software Development",
-            project_size="$75,000 - $150,000",
-            start_date="Jan 2023",
-            end_date="Aug 2023",
-            score=4.7
-        ),
+        reviewers=[
+            ReviewerInfo(
+                name="John Smith",
+                job_title="Chief Technology Officer",
+                company="FinanceCorpXYZ",
+                industry="Financial Services",
+                location="Austin, TX",
+                company_size="100-200 employees",
+                project=ProjectInfo(
+                    service_provided="Custom Enterprise Software Development",
+                    project_size="$75,000 - $150,000",
+                    start_date="Jan 2023",
+                    end_date="Aug 2023",
+                    score=4.7
+                )
+            )
+        ],
         source_url="https://clutch.co/profile/technosoft-solutions"
     )
 
-    print("Sample ScrapedData object:")
-    flat_dict = sample_data.to_flat_dict()
-    for key, value in flat_dict.items():
-        print(f"  {key}: {value}")
+    lines = [
+        SEP,
+        "DEMO: Data Models",
+        SEP,
+        "Sample ScrapedData object:",
+    ]
+
+    flat_dict = sample_data.to_flat_dict_list()[0]
+    lines.extend(f"  {key}: {value}" for key, value in flat_dict.items())
+
+    print("\n".join(lines))
 
     return [sample_data]
 
 def demo_exporter(sample_data):
     
-    print("\n" + "="*60)
-    print("DEMO: Data Export")
-    print("="*60)
+    print("\n".join([
+        "\n" + SEP,
+        "DEMO: Data Export",
+        SEP,
+    ]))
 
     exporter = AdvancedDataExporter("demo_output")
 
@@ -55,9 +64,9 @@ def demo_exporter(sample_data):
 
         exported_files = exporter.export_all_formats(sample_data, "demo_clutch_data")
 
-        print("Successfully exported sample data to:")
-        for format_type, filepath in exported_files.items():
-            print(f"  {format_type}: {filepath}")
+        lines = ["Successfully exported sample data to:"]
+        lines.extend(f"  {format_type}: {filepath}" for format_type, filepath in exported_files.items())
+        print("\n".join(lines))
 
         filtered_file = exporter.export_filtered_data(
             sample_data,
@@ -71,10 +80,6 @@ def demo_exporter(sample_data):
 
 def demo_configuration():
     
-    print("\n" + "="*60)
-    print("DEMO: Configuration")
-    print("="*60)
-
     config = ScrapingConfig(
         max_pages_per_category=2,
         max_companies_per_page=5,
@@ -88,23 +93,30 @@ def demo_configuration():
         skip_categories=[]
     )
 
-    print("Configuration:")
-    print(f"  Max pages per category: {config.max_pages_per_category}")
-    print(f"  Max companies per page: {config.max_companies_per_page}")
-    print(f"  Delay range: {config.min_delay} - {config.max_delay} seconds")
-    print(f"  Output directory: {config.output_directory}")
-
-    print("\nTargets:")
-    print(f"  Target categories: {targets.target_categories}")
-    print(f"  Skip categories: {targets.skip_categories}")
+    lines = [
+        "\n" + SEP,
+        "DEMO: Configuration",
+        SEP,
+        "Configuration:",
+        f"  Max pages per category: {config.max_pages_per_category}",
+        f"  Max companies per page: {config.max_companies_per_page}",
+        f"  Delay range: {config.min_delay} - {config.max_delay} seconds",
+        f"  Output directory: {config.output_directory}",
+        "\nTargets:",
+        f"  Target categories: {targets.target_categories}",
+        f"  Skip categories: {targets.skip_categories}",
+    ]
+    print("\n".join(lines))
 
     return config, targets
 
 def demo_command_line_usage():
     
-    print("\n" + "="*60)
-    print("DEMO: Command-Line Usage Examples")
-    print("="*60)
+    lines = [
+        "\n" + SEP,
+        "DEMO: Command-Line Usage Examples",
+        SEP,
+    ]
 
     examples = [
         ("List all available categories:", "python main.py --list-categories"),
@@ -118,92 +130,94 @@ def demo_command_line_usage():
     ]
 
     for description, command in examples:
-        print(f"\n{description}")
-        print(f"  {command}")
+        lines.append(f"\n{description}")
+        lines.append(f"  {command}")
+
+    print("\n".join(lines))
 
 def demo_scraper_features():
     
-    print("\n" + "="*60)
-    print("DEMO: Scraper Features")
-    print("="*60)
-
-    print("Key Features:")
-    print("  - Respectful scraping with rate limiting")
-    print("  - Automatic retry logic for failed requests")
-    print("  - Comprehensive error handling and logging")
-    print("  - Multiple export formats (JSON, CSV, Excel, SQLite)")
-    print("  - Configurable targeting and limits")
-    print("  - Graceful shutdown on interruption")
-    print("  - Data validation and cleaning")
-
-    print("\nData Extracted:")
-    print("  GENERAL:")
-    print("    - Category (Development)")
-    print("    - Subcategory (e.g., Software Developers)")
-    print("  COMPETITOR:")
-    print("    - Competitor name")
-    print("    - Competitor locations")
-    print("  REVIEWS:")
-    print("    - Reviewer name")
-    print("    - Reviewer job title")
-    print("    - Reviewer company")
-    print("    - Reviewer industry")
-    print("    - Reviewer location")
-    print("    - Reviewer company size")
-    print("  PROJECT:")
-    print("    - Service provided")
-    print("    - Project size")
-    print("    - Dates (start–end)")
-    print("    - Score")
-
-    print("\nAll Development Subcategories Supported:")
+    lines = [
+        "\n" + SEP,
+        "DEMO: Scraper Features",
+        SEP,
+        "Key Features:",
+        "  - Respectful scraping with rate limiting",
+        "  - Automatic retry logic for failed requests",
+        "  - Comprehensive error handling and logging",
+        "  - Multiple export formats (JSON, CSV, Excel, SQLite)",
+        "  - Configurable targeting and limits",
+        "  - Graceful shutdown on interruption",
+        "  - Data validation and cleaning",
+        "\nData Extracted:",
+        "  GENERAL:",
+        "    - Category (Development)",
+        "    - Subcategory (e.g., Software Developers)",
+        "  COMPETITOR:",
+        "    - Competitor name",
+        "    - Competitor locations",
+        "  REVIEWS:",
+        "    - Reviewer name",
+        "    - Reviewer job title",
+        "    - Reviewer company",
+        "    - Reviewer industry",
+        "    - Reviewer location",
+        "    - Reviewer company size",
+        "  PROJECT:",
+        "    - Service provided",
+        "    - Project size",
+        "    - Dates (start–end)",
+        "    - Score",
+        "\nAll Development Subcategories Supported:",
+    ]
+
     from models import DEVELOPMENT_SUBCATEGORIES
-    for slug, name in DEVELOPMENT_SUBCATEGORIES.items():
-        print(f"  - {name}")
+    lines.extend(f"  - {name}" for name in DEVELOPMENT_SUBCATEGORIES.values())
+
+    print("\n".join(lines))
 
 def demo_best_practices():
     
-    print("\n" + "="*60)
-    print("DEMO: Web Scraping Best Practices")
-    print("="*60)
-
-    print("This scraper follows these best practices:")
-
-    print("\n1. RESPECTFUL SCRAPING:")
-    print("  - Rate limiting between requests (1-3 second delays)")
-    print("  - Realistic browser headers")
-    print("  - Graceful handling of rate limit responses")
-    print("  - Configurable limits to avoid overwhelming servers")
-
-    print("\n2. ERROR HANDLING:")
-    print("  - Comprehensive exception handling")
-    print("  - Retry logic for transient failures")
-    print("  - Detailed logging for debugging")
-    print("  - Graceful degradation on errors")
-
-    print("\n3. DATA QUALITY:")
-    print("  - Data validation and cleaning")
-    print("  - Structured data models")
-    print("  - Multiple export formats")
-    print("  - Data integrity checks")
-
-    print("\n4. MAINTAINABILITY:")
-    print("  - Modular code structure")
-    print("  - Configuration-driven behavior")
-    print("  - Comprehensive documentation")
-    print("  - Easy extensibility")
-
-    print("\n5. ETHICAL CONSIDERATIONS:")
-    print("  - Respects robots.txt (when implemented)")
-    print("  - Reasonable request frequency")
-    print("  - No overwhelming of target servers")
-    print("  - Transparent user agent")
+    lines = [
+        "\n" + SEP,
+        "DEMO: Web Scraping Best Practices",
+        SEP,
+        "This scraper follows these best practices:",
+        "\n1. RESPECTFUL SCRAPING:",
+        "  - Rate limiting between requests (3-7 second delays)",
+        "  - Realistic browser headers",
+        "  - Graceful handling of rate limit responses",
+        "  - Configurable limits to avoid overwhelming servers",
+        "\n2. ERROR HANDLING:",
+        "  - Comprehensive exception handling",
+        "  - Retry logic for transient failures",
+        "  - Detailed logging for debugging",
+        "  - Graceful degradation on errors",
+        "\n3. DATA QUALITY:",
+        "  - Data validation and cleaning",
+        "  - Structured data models",
+        "  - Multiple export formats",
+        "  - Data integrity checks",
+        "\n4. MAINTAINABILITY:",
+        "  - Modular code structure",
+        "  - Configuration-driven behavior",
+        "  - Comprehensive documentation",
+        "  - Easy extensibility",
+        "\n5. ETHICAL CONSIDERATIONS:",
+        "  - Respects robots.txt (when implemented)",
+        "  - Reasonable request frequency",
+        "  - No overwhelming of target servers",
+        "  - Transparent user agent",
+    ]
+    print("\n".join(lines))
 
 def demo_troubleshooting():
     
-    print("\n" + "="*60)
-    print("DEMO: Troubleshooting Common Issues")
-    print("="*60)
+    lines = [
+        "\n" + SEP,
+        "DEMO: Troubleshooting Common Issues",
+        SEP,
+    ]
 
     issues = [
         ("403 Forbidden errors", "Site has bot protection. Try:\n    - Increasing delays between requests\n    - Using different user agents\n    - Running from different IP addresses"),
@@ -214,13 +228,17 @@ def demo_troubleshooting():
     ]
 
     for issue, solution in issues:
-        print(f"\nISSUE: {issue}")
-        print(f"SOLUTION: {solution}")
+        lines.append(f"\nISSUE: {issue}")
+        lines.append(f"SOLUTION: {solution}")
+
+    print("\n".join(lines))
 
 def main():
     
-    print("CLUTCH.CO WEB SCRAPER - COMPREHENSIVE DEMO")
-    print("This demo shows all features and capabilities")
+    print("\n".join([
+        "CLUTCH.CO WEB SCRAPER - COMPREHENSIVE DEMO",
+        "This demo shows all features and capabilities",
+    ]))
 
     logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
@@ -238,13 +256,15 @@ def main():
 
     demo_troubleshooting()
 
-    print("\n" + "="*60)
-    print("DEMO COMPLETE")
-    print("="*60)
-    print("To run the actual scraper:")
-    print("  python main.py --list-categories  # See available categories")
-    print("  python main.py --help             # See all options")
-    print("  python main.py --max-pages 1      # Quick test run")
+    print("\n".join([
+        "\n" + SEP,
+        "DEMO COMPLETE",
+        SEP,
+        "To run the actual scraper:",
+        "  python main.py --list-categories  # See available categories",
+        "  python main.py --help             # See all options",
+        "  python main.py --max-pages 1      # Quick test run",
+    ]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
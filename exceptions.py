@@ -4,6 +4,11 @@ Custom exceptions for Clutch.co scraper
 Provides specific error types for better error handling
 """
 
+from collections import Counter
+from typing import NamedTuple
+
+from config import RETRY_STATUS_CODES
+
 
 class ClutchScraperError(Exception):
     """Base exception for all scraper errors"""
@@ -62,10 +67,25 @@ class ScrapingLimitError(ClutchScraperError):
         self.current_count = current_count
 
 
+class ErrorRecord(NamedTuple):
+    """Single error captured by an ErrorContext"""
+    operation: str
+    url: str
+    context: str
+    exception_type: str
+    message: str
+
+    def as_dict(self) -> dict:
+        """Return the record as a plain dict for serialization"""
+        return self._asdict()
+
+
 # Error context manager for better error tracking
 class ErrorContext:
     """Context manager for tracking errors during scraping operations"""
 
+    __slots__ = ('operation', 'url', 'errors')
+
     def __init__(self, operation: str, url: str = None):
         self.operation = operation
         self.url = url
@@ -76,38 +96,27 @@ class ErrorContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
-            error_info = {
-                'operation': self.operation,
-                'url': self.url,
-                'exception_type': exc_type.__name__,
-                'message': str(exc_val)
-            }
-            self.errors.append(error_info)
+            self.errors.append(ErrorRecord(self.operation, self.url, None, exc_type.__name__, str(exc_val)))
 
         # Don't suppress the exception
         return False
 
     def add_error(self, error: Exception, context: str = None):
         """Manually add an error to the context"""
-        error_info = {
-            'operation': self.operation,
-            'url': self.url,
-            'context': context,
-            'exception_type': type(error).__name__,
-            'message': str(error)
-        }
-        self.errors.append(error_info)
+        self.errors.append(ErrorRecord(self.operation, self.url, context, type(error).__name__, str(error)))
 
 
 # Error recovery strategies
 class ErrorRecoveryStrategy:
     """Base class for error recovery strategies"""
 
+    __slots__ = ()
+
     def should_retry(self, error: Exception, attempt: int) -> bool:
         """Determine if operation should be retried"""
         return False
 
-    def get_retry_delay(self, attempt: int) -> float:
+    def get_retry_delay(self, attempt: int, error: Exception = None) -> float:
         """Get delay before retry"""
         return 0.0
 
@@ -119,35 +128,48 @@ class ErrorRecoveryStrategy:
 class NetworkErrorRecovery(ErrorRecoveryStrategy):
     """Recovery strategy for network errors"""
 
+    __slots__ = ('max_retries', 'base_delay', '_delays')
+
+    _RETRYABLE = (NetworkError, ConnectionError, TimeoutError)
+    _RETRY_CODES = RETRY_STATUS_CODES
+
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
         self.max_retries = max_retries
         self.base_delay = base_delay
+        # Exponential backoff delays for every attempt that can be retried
+        self._delays = tuple(base_delay * (1 << i) for i in range(max_retries + 1))
 
     def should_retry(self, error: Exception, attempt: int) -> bool:
         if attempt >= self.max_retries:
             return False
 
         if isinstance(error, NetworkError):
+            status_code = error.status_code
             # Retry on certain status codes
-            if error.status_code in [429, 500, 502, 503, 504]:
+            if status_code in self._RETRY_CODES:
                 return True
             # Don't retry on client errors
-            if error.status_code and 400 <= error.status_code < 500:
+            if status_code is not None and 400 <= status_code < 500:
                 return False
+            return True
 
-        return isinstance(error, (NetworkError, ConnectionError, TimeoutError))
+        return isinstance(error, self._RETRYABLE)
 
-    def get_retry_delay(self, attempt: int) -> float:
+    def get_retry_delay(self, attempt: int, error: Exception = None) -> float:
         # Exponential backoff
-        return self.base_delay * (2 ** attempt)
+        if attempt < len(self._delays):
+            return self._delays[attempt]
+        return self.base_delay * (1 << attempt)
 
     def can_recover(self, error: Exception) -> bool:
-        return isinstance(error, (NetworkError, ConnectionError, TimeoutError))
+        return isinstance(error, self._RETRYABLE)
 
 
 class ParsingErrorRecovery(ErrorRecoveryStrategy):
     """Recovery strategy for parsing errors"""
 
+    __slots__ = ()
+
     def should_retry(self, error: Exception, attempt: int) -> bool:
         # Generally don't retry parsing errors
         return False
@@ -160,13 +182,18 @@ class ParsingErrorRecovery(ErrorRecoveryStrategy):
 class RateLimitRecovery(ErrorRecoveryStrategy):
     """Recovery strategy for rate limiting errors"""
 
+    __slots__ = ()
+
+    # Longer delays for rate limits, indexed by attempt
+    _DELAY_TABLE = (30.0, 60.0, 90.0)
+
     def should_retry(self, error: Exception, attempt: int) -> bool:
         return isinstance(error, RateLimitError) and attempt < 3
 
-    def get_retry_delay(self, attempt: int) -> float:
+    def get_retry_delay(self, attempt: int, error: Exception = None) -> float:
         if isinstance(error, RateLimitError) and error.retry_after:
             return error.retry_after
-        return 30.0 * (attempt + 1)  # Longer delay for rate limits
+        return self._DELAY_TABLE[min(attempt, len(self._DELAY_TABLE) - 1)]
 
     def can_recover(self, error: Exception) -> bool:
         return isinstance(error, RateLimitError)
@@ -177,12 +204,21 @@ class ErrorHandler:
     """Centralized error handling with recovery strategies"""
 
     def __init__(self):
-        self.strategies = [
-            NetworkErrorRecovery(),
-            ParsingErrorRecovery(),
-            RateLimitRecovery()
-        ]
-        self.error_counts = {}
+        network_recovery = NetworkErrorRecovery()
+        parsing_recovery = ParsingErrorRecovery()
+        rate_limit_recovery = RateLimitRecovery()
+
+        self.strategies = [network_recovery, parsing_recovery, rate_limit_recovery]
+
+        # Exception type -> strategy, resolved along the error's MRO
+        self._dispatch = {
+            NetworkError: network_recovery,
+            ConnectionError: network_recovery,
+            TimeoutError: network_recovery,
+            ParsingError: parsing_recovery,
+            RateLimitError: rate_limit_recovery
+        }
+        self.error_counts = Counter()  # keyed by exception class
 
     def handle_error(self, error: Exception, context: str = None) -> dict:
         """
@@ -191,38 +227,49 @@ class ErrorHandler:
         Returns:
             dict with keys: can_retry, should_retry, delay, strategy
         """
-        error_type = type(error).__name__
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        error_cls = type(error)
+        self.error_counts[error_cls] += 1
 
         recovery_info = {
             'can_retry': False,
             'should_retry': False,
             'delay': 0.0,
             'strategy': None,
-            'attempt': self.error_counts[error_type]
+            'attempt': self.error_counts[error_cls]
         }
 
         # Find appropriate strategy
-        for strategy in self.strategies:
-            if strategy.can_recover(error):
-                recovery_info['can_retry'] = True
-                recovery_info['should_retry'] = strategy.should_retry(error, recovery_info['attempt'])
-                recovery_info['delay'] = strategy.get_retry_delay(recovery_info['attempt'])
-                recovery_info['strategy'] = strategy.__class__.__name__
-                break
+        strategy = self._find_strategy(error)
+        if strategy is not None and strategy.can_recover(error):
+            recovery_info['can_retry'] = True
+            recovery_info['should_retry'] = strategy.should_retry(error, recovery_info['attempt'])
+            recovery_info['delay'] = strategy.get_retry_delay(recovery_info['attempt'], error)
+            recovery_info['strategy'] = strategy.__class__.__name__
 
         return recovery_info
 
+    def _find_strategy(self, error: Exception):
+        """Return the strategy registered for the closest class in the error's MRO"""
+        for cls in type(error).__mro__:
+            strategy = self._dispatch.get(cls)
+            if strategy is not None:
+                return strategy
+        return None
+
     def reset_error_count(self, error_type: str = None):
         """Reset error count for specific type or all types"""
         if error_type:
-            self.error_counts.pop(error_type, None)
+            for error_cls in [cls for cls in self.error_counts if cls.__name__ == error_type]:
+                del self.error_counts[error_cls]
         else:
             self.error_counts.clear()
 
     def get_error_summary(self) -> dict:
-        """Get summary of all errors encountered"""
-        return dict(self.error_counts)
+        """Get summary of all errors encountered, keyed by exception type name"""
+        summary = Counter()
+        for error_cls, count in self.error_counts.items():
+            summary[error_cls.__name__] += count
+        return dict(summary)
 
 
 if __name__ == "__main__":
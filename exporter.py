@@ -2,16 +2,78 @@
 
 import json
 import csv
+import itertools
+import operator
 import sqlite3
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union, get_args, get_origin, get_type_hints
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
-from models import ScrapedData
+from models import ScrapedData, FLAT_COLUMN_SOURCES, FLAT_COLUMNS
 from exceptions import ExportError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_record(record: Dict[str, Any]) -> bytes:
+    """Serialize one record as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(record, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+def _sqlite_column_type(annotation) -> str:
+    """Map a dataclass field annotation to an SQLite column type"""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+
+    if annotation is bool:
+        return "INTEGER"
+    if annotation in (int, float):
+        return "REAL"
+    return "TEXT"
+
+
+# SQLite column types for the flat export rows, derived from the model annotations
+FIELD_TYPES: Dict[str, str] = {
+    column: _sqlite_column_type(get_type_hints(cls)[attribute])
+    for column, (cls, attribute) in FLAT_COLUMN_SOURCES.items()
+}
+
+# Flat rows always carry the same columns, so the row getter and SQL are built once
+_FLAT_ROW_VALUES = operator.itemgetter(*FLAT_COLUMNS)
+_SQLITE_CREATE_SQL = (
+    "CREATE TABLE IF NOT EXISTS scraped_data ("
+    + ', '.join(f"{column} {FIELD_TYPES[column]}" for column in FLAT_COLUMNS)
+    + ")"
+)
+_SQLITE_INSERT_SQL = (
+    f"INSERT INTO scraped_data ({', '.join(FLAT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in FLAT_COLUMNS)})"
+)
+
+def _has_min_score(item: ScrapedData, min_score: float) -> bool:
+    """Check whether any review of the item has a project score of at least min_score"""
+    return any(
+        reviewer.project and reviewer.project.score and reviewer.project.score >= min_score
+        for reviewer in item.reviewers or ()
+    )
+
+
+# Filter field -> builder returning a predicate over ScrapedData for the given value
+FILTER_BUILDERS = {
+    'subcategory': lambda value: lambda item: item.subcategory == value,
+    'company_name': lambda value: lambda item: bool(item.competitor) and item.competitor.name == value,
+    'min_score': lambda value: lambda item: _has_min_score(item, value),
+}
+
 class AdvancedDataExporter:
 
     def __init__(self, output_directory: str = "output"):
@@ -25,27 +87,43 @@ class AdvancedDataExporter:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             base_filename = f"clutch_data_{timestamp}"
 
-        exported_files = {}
-
-        try:
+        # Flatten once and share the rows between the tabular formats
+        flat = self._flatten_all(data)
 
-            json_file = self.export_to_json(data, f"{base_filename}.json")
-            exported_files['json'] = json_file
+        # Every format writes its own file, so run them side by side
+        exports = {
+            'json': (self.export_to_json, f"{base_filename}.json"),
+            'csv': (partial(self.export_to_csv, flat=flat), f"{base_filename}.csv"),
+            'excel': (partial(self.export_to_excel, flat=flat), f"{base_filename}.xlsx"),
+            'sqlite': (partial(self.export_to_sqlite, flat=flat), f"{base_filename}.db"),
+            'summary': (self.export_summary_report, f"{base_filename}_summary.txt"),
+        }
 
-            csv_file = self.export_to_csv(data, f"{base_filename}.csv")
-            exported_files['csv'] = csv_file
+        exported_files = {}
 
-            try:
-                excel_file = self.export_to_excel(data, f"{base_filename}.xlsx")
-                exported_files['excel'] = excel_file
-            except ImportError:
-                logging.warning("pandas not available, skipping Excel export")
+        try:
 
-            sqlite_file = self.export_to_sqlite(data, f"{base_filename}.db")
-            exported_files['sqlite'] = sqlite_file
+            with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                futures = {
+                    executor.submit(export, data, filename): format_type
+                    for format_type, (export, filename) in exports.items()
+                }
+
+                for future in as_completed(futures):
+                    format_type = futures[future]
+                    error = future.exception()
+                    if error is None:
+                        exported_files[format_type] = future.result()
+                    elif format_type == 'excel' and isinstance(error, ImportError):
+                        logging.warning("pandas not available, skipping Excel export")
+                    else:
+                        raise error
 
-            summary_file = self.export_summary_report(data, f"{base_filename}_summary.txt")
-            exported_files['summary'] = summary_file
+            # Report formats in a stable order regardless of completion order
+            exported_files = {
+                format_type: exported_files[format_type]
+                for format_type in exports if format_type in exported_files
+            }
 
             logging.info(f"Exported data to {len(exported_files)} formats")
 
@@ -54,14 +132,29 @@ class AdvancedDataExporter:
 
         return exported_files
 
+    @staticmethod
+    def _flatten_all(data: List[ScrapedData]) -> List[List[Dict[str, Any]]]:
+        """Flatten every record once, keeping one row list per item"""
+        return [item.to_flat_dict_list() for item in data]
+
+    @staticmethod
+    def _iter_flat_rows(data: List[ScrapedData], flat: Optional[List[List[Dict[str, Any]]]] = None):
+        """Iterate over all flat rows, reusing pre-flattened rows when given"""
+        per_item = flat if flat is not None else (item.to_flat_dict_list() for item in data)
+        return itertools.chain.from_iterable(per_item)
+
     def export_to_json(self, data: List[ScrapedData], filename: str) -> str:
         
         try:
             output_path = self.output_directory / filename
-            json_data = [item.to_dict() for item in data]
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+            # Stream one record at a time instead of building the whole array in memory
+            with open(output_path, 'wb') as f:
+                f.write(b'[')
+                for i, item in enumerate(data):
+                    f.write(b',\n' if i else b'\n')
+                    f.write(_dump_json_record(item.to_dict()))
+                f.write(b'\n]' if data else b']')
 
             logging.info(f"Exported {len(data)} records to {output_path}")
             return str(output_path)
@@ -69,7 +162,8 @@ class AdvancedDataExporter:
         except Exception as e:
             raise ExportError(f"JSON export failed: {e}", format_type="json", filename=filename)
 
-    def export_to_csv(self, data: List[ScrapedData], filename: str) -> str:
+    def export_to_csv(self, data: List[ScrapedData], filename: str,
+                      flat: Optional[List[List[Dict[str, Any]]]] = None) -> str:
         
         try:
             output_path = self.output_directory / filename
@@ -78,17 +172,11 @@ class AdvancedDataExporter:
                 logging.warning("No data to export to CSV")
                 return str(output_path)
 
-            first_record_rows = data[0].to_flat_dict_list()
-            fieldnames = list(first_record_rows[0].keys()) if first_record_rows else []
-
+            # Pull columns out positionally in C instead of DictWriter's per-field lookups
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for item in data:
-                    rows = item.to_flat_dict_list()
-                    for row in rows:
-                        writer.writerow(row)
+                writer = csv.writer(f)
+                writer.writerow(FLAT_COLUMNS)
+                writer.writerows(map(_FLAT_ROW_VALUES, self._iter_flat_rows(data, flat)))
 
             logging.info(f"Exported {len(data)} records to {output_path}")
             return str(output_path)
@@ -96,7 +184,8 @@ class AdvancedDataExporter:
         except Exception as e:
             raise ExportError(f"CSV export failed: {e}", format_type="csv", filename=filename)
 
-    def export_to_excel(self, data: List[ScrapedData], filename: str) -> str:
+    def export_to_excel(self, data: List[ScrapedData], filename: str,
+                        flat: Optional[List[List[Dict[str, Any]]]] = None) -> str:
         
         try:
             import pandas as pd
@@ -107,10 +196,7 @@ class AdvancedDataExporter:
                 logging.warning("No data to export to Excel")
                 return str(output_path)
 
-            flat_data = []
-            for item in data:
-                flat_data.extend(item.to_flat_dict_list())
-            df = pd.DataFrame(flat_data)
+            df = pd.DataFrame.from_records(self._iter_flat_rows(data, flat))
 
             with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
 
@@ -121,8 +207,7 @@ class AdvancedDataExporter:
                     summary.to_excel(writer, sheet_name='Summary by Category', index=False)
 
                 if 'competitor_name' in df.columns:
-                    companies = df['competitor_name'].value_counts().reset_index()
-                    companies.columns = ['company', 'review_count']
+                    companies = df['competitor_name'].value_counts().rename_axis('company').reset_index(name='review_count')
                     companies.to_excel(writer, sheet_name='Companies Summary', index=False)
 
             logging.info(f"Exported {len(data)} records to {output_path}")
@@ -133,45 +218,55 @@ class AdvancedDataExporter:
         except Exception as e:
             raise ExportError(f"Excel export failed: {e}", format_type="excel", filename=filename)
 
-    def export_to_sqlite(self, data: List[ScrapedData], filename: str) -> str:
+    def export_to_parquet(self, data: List[ScrapedData], filename: str,
+                          flat: Optional[List[List[Dict[str, Any]]]] = None) -> str:
         
         try:
             output_path = self.output_directory / filename
 
-            if output_path.exists():
-                output_path.unlink()
+            if not data:
+                logging.warning("No data to export to Parquet")
+                return str(output_path)
 
-            conn = sqlite3.connect(output_path)
-            cursor = conn.cursor()
+            # Columnar layout: much smaller than CSV and far faster to load back
+            df = pd.DataFrame.from_records(self._iter_flat_rows(data, flat))
+            df.to_parquet(output_path, index=False)
 
-            if data:
-                sample_rows = data[0].to_flat_dict_list()
-                sample_dict = sample_rows[0] if sample_rows else {}
-                columns = []
-                for key in sample_dict.keys():
-
-                    value = sample_dict[key]
-                    if isinstance(value, (int, float)):
-                        col_type = "REAL"
-                    elif isinstance(value, bool):
-                        col_type = "INTEGER"
-                    else:
-                        col_type = "TEXT"
+            logging.info(f"Exported {len(data)} records to {output_path}")
+            return str(output_path)
+
+        except ImportError:
+            raise ExportError("pyarrow or fastparquet is required for Parquet export",
+                              format_type="parquet", filename=filename)
+        except Exception as e:
+            raise ExportError(f"Parquet export failed: {e}", format_type="parquet", filename=filename)
+
+    def export_to_sqlite(self, data: List[ScrapedData], filename: str,
+                         flat: Optional[List[List[Dict[str, Any]]]] = None) -> str:
+        
+        try:
+            output_path = self.output_directory / filename
 
-                    columns.append(f"{key} {col_type}")
+            conn = sqlite3.connect(output_path)
+            cursor = conn.cursor()
 
-                create_table_sql = f"CREATE TABLE IF NOT EXISTS scraped_data ({', '.join(columns)})"
-                cursor.execute(create_table_sql)
+            # The file is written once and never read concurrently, so skip durability
+            # work and give the bulk insert a large in-memory page cache
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
 
-                placeholders = ', '.join(['?' for _ in sample_dict.keys()])
-                insert_sql = f"INSERT INTO scraped_data ({', '.join(sample_dict.keys())}) VALUES ({placeholders})"
+            # Replace any table left by a previous export to the same file
+            cursor.execute("DROP TABLE IF EXISTS scraped_data")
 
-                for item in data:
-                    flat_rows = item.to_flat_dict_list()
-                    for flat_dict in flat_rows:
-                        values = [flat_dict.get(key) for key in sample_dict.keys()]
-                        cursor.execute(insert_sql, values)
+            if data:
+                cursor.execute(_SQLITE_CREATE_SQL)
 
+                # Insert everything inside one explicit transaction
+                cursor.execute("BEGIN")
+                cursor.executemany(_SQLITE_INSERT_SQL, map(_FLAT_ROW_VALUES, self._iter_flat_rows(data, flat)))
                 conn.commit()
 
             conn.close()
@@ -182,68 +277,87 @@ class AdvancedDataExporter:
         except Exception as e:
             raise ExportError(f"SQLite export failed: {e}", format_type="sqlite", filename=filename)
 
+    @staticmethod
+    def _build_summary_report(data: List[ScrapedData]) -> str:
+        """Render the summary report text in memory"""
+        parts = []
+        write = parts.append
+
+        write("CLUTCH.CO SCRAPING SUMMARY REPORT\n")
+        write("=" * 50 + "\n\n")
+
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Total Records: {len(data)}\n\n")
+
+        if not data:
+            write("No data to summarize.\n")
+            return "".join(parts)
+
+        # Gather every count in a single pass over the data
+        subcategories = Counter()
+        companies = set()
+        reviewers = set()
+        company_names = 0
+        reviewer_names = 0
+        project_scores = 0
+
+        for item in data:
+            subcategories[item.subcategory or "Unknown"] += 1
+
+            competitor = item.competitor
+            if competitor and competitor.name:
+                companies.add(competitor.name)
+                company_names += 1
+
+            item_reviewers = item.reviewers
+            if item_reviewers:
+                names = [reviewer.name for reviewer in item_reviewers if reviewer.name]
+                reviewers.update(names)
+                reviewer_names += len(names)
+                project_scores += sum(
+                    1 for reviewer in item_reviewers
+                    if reviewer.project and reviewer.project.score
+                )
+
+        write("BREAKDOWN BY SUBCATEGORY:\n")
+        write("-" * 30 + "\n")
+        for subcat, count in sorted(subcategories.items()):
+            write(f"{subcat}: {count} records\n")
+
+        write(f"\nUNIQUE COMPANIES: {len(companies)}\n")
+        write(f"UNIQUE REVIEWERS: {len(reviewers)}\n\n")
+
+        write("SAMPLE RECORDS:\n")
+        write("-" * 20 + "\n")
+        for i, item in enumerate(data[:5], 1):
+            write(f"\nRecord {i}:\n")
+            write(f"  Category: {item.subcategory}\n")
+            write(f"  Company: {item.competitor.name if item.competitor else 'N/A'}\n")
+            reviewers_str = ", ".join([r.name for r in item.reviewers if r.name]) if item.reviewers else "N/A"
+            write(f"  Reviewers: {reviewers_str}\n")
+            scores = [r.project.score for r in item.reviewers if r.project and r.project.score] if item.reviewers else []
+            avg_score = sum(scores) / len(scores) if scores else "N/A"
+            write(f"  Avg Project Score: {avg_score}\n")
+
+        write("\nDATA QUALITY METRICS:\n")
+        write("-" * 25 + "\n")
+
+        write(f"Company names populated: {company_names}/{len(data)} ({company_names/len(data)*100:.1f}%)\n")
+        write(f"Reviewer names populated: {reviewer_names}/{len(data)} ({reviewer_names/len(data)*100:.1f}%)\n")
+        write(f"Project scores populated: {project_scores}/{len(data)} ({project_scores/len(data)*100:.1f}%)\n")
+
+        return "".join(parts)
+
     def export_summary_report(self, data: List[ScrapedData], filename: str) -> str:
         
         try:
             output_path = self.output_directory / filename
 
+            # Render the whole report first so the file gets a single write
+            report = self._build_summary_report(data)
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("CLUTCH.CO SCRAPING SUMMARY REPORT\n")
-                f.write("=" * 50 + "\n\n")
-
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Records: {len(data)}\n\n")
-
-                if not data:
-                    f.write("No data to summarize.\n")
-                    return str(output_path)
-
-                subcategories = {}
-                companies = set()
-                reviewers = set()
-
-                for item in data:
-                    subcat = item.subcategory or "Unknown"
-                    subcategories[subcat] = subcategories.get(subcat, 0) + 1
-
-                    if item.competitor and item.competitor.name:
-                        companies.add(item.competitor.name)
-
-                    if item.reviewers:
-                        for reviewer in item.reviewers:
-                            if reviewer.name:
-                                reviewers.add(reviewer.name)
-
-                f.write("BREAKDOWN BY SUBCATEGORY:\n")
-                f.write("-" * 30 + "\n")
-                for subcat, count in sorted(subcategories.items()):
-                    f.write(f"{subcat}: {count} records\n")
-
-                f.write(f"\nUNIQUE COMPANIES: {len(companies)}\n")
-                f.write(f"UNIQUE REVIEWERS: {len(reviewers)}\n\n")
-
-                f.write("SAMPLE RECORDS:\n")
-                f.write("-" * 20 + "\n")
-                for i, item in enumerate(data[:5], 1):
-                    f.write(f"\nRecord {i}:\n")
-                    f.write(f"  Category: {item.subcategory}\n")
-                    f.write(f"  Company: {item.competitor.name if item.competitor else 'N/A'}\n")
-                    reviewers_str = ", ".join([r.name for r in item.reviewers if r.name]) if item.reviewers else "N/A"
-                    f.write(f"  Reviewers: {reviewers_str}\n")
-                    scores = [r.project.score for r in item.reviewers if r.project and r.project.score] if item.reviewers else []
-                    avg_score = sum(scores) / len(scores) if scores else "N/A"
-                    f.write(f"  Avg Project Score: {avg_score}\n")
-
-                f.write("\nDATA QUALITY METRICS:\n")
-                f.write("-" * 25 + "\n")
-
-                company_names = sum(1 for item in data if item.competitor and item.competitor.name)
-                reviewer_names = sum(len([r for r in item.reviewers if r.name]) for item in data if item.reviewers)
-                project_scores = sum(len([r for r in item.reviewers if r.project and r.project.score]) for item in data if item.reviewers)
-
-                f.write(f"Company names populated: {company_names}/{len(data)} ({company_names/len(data)*100:.1f}%)\n")
-                f.write(f"Reviewer names populated: {reviewer_names}/{len(data)} ({reviewer_names/len(data)*100:.1f}%)\n")
-                f.write(f"Project scores populated: {project_scores}/{len(data)} ({project_scores/len(data)*100:.1f}%)\n")
+                f.write(report)
 
             logging.info(f"Generated summary report at {output_path}")
             return str(output_path)
@@ -254,24 +368,14 @@ class AdvancedDataExporter:
     def export_filtered_data(self, data: List[ScrapedData], filters: Dict[str, Any], filename: str) -> str:
         
         try:
-            filtered_data = []
-
-            for item in data:
-                include = True
-
-                for field, value in filters.items():
-                    if field == 'subcategory' and item.subcategory != value:
-                        include = False
-                        break
-                    elif field == 'company_name' and (not item.competitor or item.competitor.name != value):
-                        include = False
-                        break
-                    elif field == 'min_score' and (not item.project or not item.project.score or item.project.score < value):
-                        include = False
-                        break
-
-                if include:
-                    filtered_data.append(item)
+            predicates = []
+            for field, value in filters.items():
+                builder = FILTER_BUILDERS.get(field)
+                if builder is None:
+                    raise ValueError(f"Unknown filter field: {field}")
+                predicates.append(builder(value))
+
+            filtered_data = [item for item in data if all(predicate(item) for predicate in predicates)]
 
             output_path = self.export_to_csv(filtered_data, filename)
             logging.info(f"Exported {len(filtered_data)} filtered records (from {len(data)} total)")
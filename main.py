@@ -2,8 +2,11 @@
 
 import argparse
 import logging
+import os
 import sys
 import signal
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
 from typing import List, Optional
 
@@ -14,6 +17,9 @@ from models import ScrapedData, DEVELOPMENT_SUBCATEGORIES
 from exceptions import ClutchScraperError, ErrorHandler
 from utils import setup_logging
 
+# Lowercased category name -> (url, name), for case-insensitive target lookup
+_BY_LOWER_NAME = {name.lower(): (url, name) for url, name in DEVELOPMENT_SUBCATEGORIES.items()}
+
 class ClutchScrapingManager:
 
     def __init__(self, config: ScrapingConfig, targets: ScrapingTargets):
@@ -25,18 +31,33 @@ class ClutchScrapingManager:
         self.error_handler = ErrorHandler()
         self.scraped_data: List[ScrapedData] = []
         self.interrupted = False
-
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._previous_handlers = {}
 
     def _signal_handler(self, signum, _frame):
         
         logging.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.interrupted = True
 
+    def _install_signal_handlers(self):
+        
+        signums = [signal.SIGINT]
+        if hasattr(signal, 'SIGTERM') and os.name == 'posix':
+            signums.append(signal.SIGTERM)
+
+        for signum in signums:
+            self._previous_handlers[signum] = signal.signal(signum, self._signal_handler)
+
+    def _restore_signal_handlers(self):
+        
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler if handler is not None else signal.SIG_DFL)
+        self._previous_handlers.clear()
+
     def run(self) -> bool:
         
         try:
+            self._install_signal_handlers()
+
             logging.info("Starting Clutch.co scraping process")
             logging.info(f"Configuration: {self.config}")
             logging.info(f"Targets: {self.targets}")
@@ -76,7 +97,10 @@ class ClutchScrapingManager:
 
             self.scraper = ClutchScraper(
                 max_pages_per_category=self.config.max_pages_per_category,
-                max_companies_per_page=self.config.max_companies_per_page
+                max_companies_per_page=self.config.max_companies_per_page,
+                http_cache_path=self.config.http_cache_path,
+                min_delay=self.config.min_delay,
+                max_delay=self.config.max_delay
             )
 
             self.exporter = AdvancedDataExporter(self.config.output_directory)
@@ -96,18 +120,17 @@ class ClutchScrapingManager:
 
             categories = {}
             for target in self.targets.target_categories:
-
-                for url, name in all_categories.items():
-                    if target.lower() == name.lower():
-                        categories[url] = name
-                        break
+                hit = _BY_LOWER_NAME.get(target.lower())
+                if hit:
+                    url, name = hit
+                    categories[url] = name
                 else:
                     logging.warning(f"Target category not found: {target}")
         else:
 
             categories = {}
             for url, name in all_categories.items():
-                if name not in self.targets.skip_categories:
+                if self.targets.should_scrape(name):
                     categories[url] = name
 
         return categories
@@ -183,15 +206,11 @@ class ClutchScrapingManager:
 
         if self.scraped_data:
 
-            category_counts = {}
-            company_names = set()
-
-            for item in self.scraped_data:
-                subcat = item.subcategory or "Unknown"
-                category_counts[subcat] = category_counts.get(subcat, 0) + 1
-
-                if item.competitor and item.competitor.name:
-                    company_names.add(item.competitor.name)
+            category_counts = Counter(item.subcategory or "Unknown" for item in self.scraped_data)
+            company_names = {
+                item.competitor.name for item in self.scraped_data
+                if item.competitor and item.competitor.name
+            }
 
             print(f"Unique companies: {len(company_names)}")
             print(f"Categories scraped: {len(category_counts)}")
@@ -212,6 +231,7 @@ class ClutchScrapingManager:
         
         if self.scraper:
             self.scraper.close()
+        self._restore_signal_handlers()
         logging.info("Cleanup completed")
 
 def create_parser() -> argparse.ArgumentParser:
@@ -257,6 +277,14 @@ def create_parser() -> argparse.ArgumentParser:
         help='Maximum delay between requests in seconds'
     )
 
+    parser.add_argument(
+        '--delay-range',
+        nargs=2,
+        type=float,
+        metavar=('MIN', 'MAX'),
+        help='Minimum and maximum delay between requests in seconds (overrides --min-delay/--max-delay)'
+    )
+
     parser.add_argument(
         '--output-dir',
         help='Output directory for exported files'
@@ -294,35 +322,44 @@ def main():
             print(f"  URL: {url}")
         return
 
+    # The env configuration is cached per process, so apply CLI overrides to copies
     config = get_config_from_env()
     targets = get_targets_from_env()
 
+    target_overrides = {}
     if args.categories:
-        targets.target_categories = args.categories
+        target_overrides['target_categories'] = tuple(args.categories)
 
     if args.skip_categories:
-        targets.skip_categories = args.skip_categories
+        target_overrides['skip_categories'] = tuple(args.skip_categories)
 
-    if args.max_pages:
-        config.max_pages_per_category = args.max_pages
+    config_overrides = {}
+    if args.max_pages is not None:
+        config_overrides['max_pages_per_category'] = args.max_pages
 
-    if args.max_companies:
-        config.max_companies_per_page = args.max_companies
+    if args.max_companies is not None:
+        config_overrides['max_companies_per_page'] = args.max_companies
 
-    if args.min_delay:
-        config.min_delay = args.min_delay
+    if args.min_delay is not None:
+        config_overrides['min_delay'] = args.min_delay
 
-    if args.max_delay:
-        config.max_delay = args.max_delay
+    if args.max_delay is not None:
+        config_overrides['max_delay'] = args.max_delay
+
+    if args.delay_range is not None:
+        config_overrides['min_delay'], config_overrides['max_delay'] = args.delay_range
 
     if args.output_dir:
-        config.output_directory = args.output_dir
+        config_overrides['output_directory'] = args.output_dir
 
     if args.log_level:
-        config.log_level = args.log_level
+        config_overrides['log_level'] = args.log_level
 
     if args.log_file:
-        config.log_file = args.log_file
+        config_overrides['log_file'] = args.log_file
+
+    config = replace(config, **config_overrides)
+    targets = replace(targets, **target_overrides)
 
     setup_logging(
         log_file=config.log_file,
@@ -1,13 +1,51 @@
 #!/usr/bin/env python3
 
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 import json
 import csv
+import sys
 from datetime import datetime
+from operator import attrgetter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Timestamp shared by every ScrapedData created inside a shared_timestamp() block; a context
+# variable, so overlapping blocks in different threads each see their own batch
+_batch_timestamp: ContextVar[Optional[str]] = ContextVar('batch_timestamp', default=None)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Low-cardinality fields repeat across thousands of records; keep one copy of each value
+    return sys.intern(value) if type(value) is str else value
+
+
+# Write buffer for CSV exports; large enough that big exports need few write calls
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def shared_timestamp():
+    current = _batch_timestamp.get()
+    if current is not None:
+        yield current
+        return
+
+    timestamp = datetime.now().isoformat()
+    token = _batch_timestamp.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _batch_timestamp.reset(token)
+
+
+@dataclass(slots=True)
 class ProjectInfo:
     service_provided: Optional[str] = None
     project_size: Optional[str] = None
@@ -19,8 +57,25 @@ class ProjectInfo:
     score_cost: Optional[float] = None
     score_willing_to_refer: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'service_provided': self.service_provided,
+            'project_size': self.project_size,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'score': self.score,
+            'score_quality': self.score_quality,
+            'score_schedule': self.score_schedule,
+            'score_cost': self.score_cost,
+            'score_willing_to_refer': self.score_willing_to_refer,
+        }
+
 
-@dataclass
+# Stand-in for a missing reviewer project, so row building needs no per-field None checks
+_EMPTY_PROJECT = ProjectInfo()
+
+
+@dataclass(slots=True)
 class ReviewerInfo:
     name: Optional[str] = None
     job_title: Optional[str] = None
@@ -34,8 +89,23 @@ class ReviewerInfo:
         if self.project is None:
             self.project = ProjectInfo()
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'job_title': self.job_title,
+            'company': self.company,
+            'industry': self.industry,
+            'location': self.location,
+            'company_size': self.company_size,
+            'project': self.project.to_dict() if self.project else None,
+        }
+
+    def dedup_key(self) -> tuple:
+        # Hashable identity for set-based dedup; the dataclass itself stays mutable
+        return (self.name or "", self.company or "", self.job_title or "")
+
+
+@dataclass(slots=True)
 class CompetitorInfo:
     name: Optional[str] = None
     locations: List[str] = None
@@ -44,8 +114,18 @@ class CompetitorInfo:
         if self.locations is None:
             self.locations = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            # Shared rather than copied: to_dict output is only read for serialization
+            'locations': self.locations,
+        }
+
+    def dedup_key(self) -> Optional[str]:
+        return self.name.lower().strip() if self.name else None
 
-@dataclass
+
+@dataclass(slots=True)
 class ScrapedData:
     category: str = "Development"
     subcategory: Optional[str] = None
@@ -56,8 +136,10 @@ class ScrapedData:
     source_url_review: Optional[str] = None
 
     def __post_init__(self):
+        self.category = _intern(self.category)
+        self.subcategory = _intern(self.subcategory)
         if self.scraped_at is None:
-            self.scraped_at = datetime.now().isoformat()
+            self.scraped_at = _batch_timestamp.get() or datetime.now().isoformat()
         if self.competitor is None:
             self.competitor = CompetitorInfo()
         if self.reviewers is None:
@@ -66,63 +148,105 @@ class ScrapedData:
             self.source_url_review = f"{self.source_url}#reviews"
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand rather than with asdict(), which recurses and deep-copies every field
+        return {
+            'category': self.category,
+            'subcategory': self.subcategory,
+            'competitor': self.competitor.to_dict() if self.competitor else None,
+            'reviewers': [reviewer.to_dict() for reviewer in self.reviewers] if self.reviewers is not None else None,
+            'scraped_at': self.scraped_at,
+            'source_url': self.source_url,
+            'source_url_review': self.source_url_review,
+        }
+
+    def to_flat_rows(self) -> List[tuple]:
+        # One tuple per reviewer (or a single one without reviewers), in FLAT_COLUMNS order
+        return _build_flat_rows(self)
 
     def to_flat_dict_list(self) -> List[Dict[str, Any]]:
-        if not self.reviewers:
-            return [{
-                'category': self.category,
-                'subcategory': self.subcategory,
-                'scraped_at': self.scraped_at,
-                'source_url': self.source_url,
-                'source_url_review': self.source_url_review,
-                'competitor_name': self.competitor.name if self.competitor else None,
-                'competitor_locations': ', '.join(self.competitor.locations) if self.competitor and self.competitor.locations else None,
-                'reviewer_name': None,
-                'reviewer_job_title': None,
-                'reviewer_company': None,
-                'reviewer_industry': None,
-                'reviewer_location': None,
-                'reviewer_company_size': None,
-                'service_provided': None,
-                'project_size': None,
-                'project_start_date': None,
-                'project_end_date': None,
-                'project_score': None,
-                'project_score_quality': None,
-                'project_score_schedule': None,
-                'project_score_cost': None,
-                'project_score_willing_to_refer': None,
-            }]
-
-        rows = []
-        for reviewer in self.reviewers:
-            row = {
-                'category': self.category,
-                'subcategory': self.subcategory,
-                'scraped_at': self.scraped_at,
-                'source_url': self.source_url,
-                'source_url_review': self.source_url_review,
-                'competitor_name': self.competitor.name if self.competitor else None,
-                'competitor_locations': ', '.join(self.competitor.locations) if self.competitor and self.competitor.locations else None,
-                'reviewer_name': reviewer.name,
-                'reviewer_job_title': reviewer.job_title,
-                'reviewer_company': reviewer.company,
-                'reviewer_industry': reviewer.industry,
-                'reviewer_location': reviewer.location,
-                'reviewer_company_size': reviewer.company_size,
-                'service_provided': reviewer.project.service_provided if reviewer.project else None,
-                'project_size': reviewer.project.project_size if reviewer.project else None,
-                'project_start_date': reviewer.project.start_date if reviewer.project else None,
-                'project_end_date': reviewer.project.end_date if reviewer.project else None,
-                'project_score': reviewer.project.score if reviewer.project else None,
-                'project_score_quality': reviewer.project.score_quality if reviewer.project else None,
-                'project_score_schedule': reviewer.project.score_schedule if reviewer.project else None,
-                'project_score_cost': reviewer.project.score_cost if reviewer.project else None,
-                'project_score_willing_to_refer': reviewer.project.score_willing_to_refer if reviewer.project else None,
-            }
-            rows.append(row)
-        return rows
+        # Derived from the row builder, so FLAT_COLUMN_SOURCES is the only column layout
+        return [dict(zip(FLAT_COLUMNS, row)) for row in _build_flat_rows(self)]
+
+
+# Flat export column -> (dataclass, attribute) it is read from, in column order
+FLAT_COLUMN_SOURCES = {
+    'category': (ScrapedData, 'category'),
+    'subcategory': (ScrapedData, 'subcategory'),
+    'scraped_at': (ScrapedData, 'scraped_at'),
+    'source_url': (ScrapedData, 'source_url'),
+    'source_url_review': (ScrapedData, 'source_url_review'),
+    'competitor_name': (CompetitorInfo, 'name'),
+    'competitor_locations': (CompetitorInfo, 'locations'),
+    'reviewer_name': (ReviewerInfo, 'name'),
+    'reviewer_job_title': (ReviewerInfo, 'job_title'),
+    'reviewer_company': (ReviewerInfo, 'company'),
+    'reviewer_industry': (ReviewerInfo, 'industry'),
+    'reviewer_location': (ReviewerInfo, 'location'),
+    'reviewer_company_size': (ReviewerInfo, 'company_size'),
+    'service_provided': (ProjectInfo, 'service_provided'),
+    'project_size': (ProjectInfo, 'project_size'),
+    'project_start_date': (ProjectInfo, 'start_date'),
+    'project_end_date': (ProjectInfo, 'end_date'),
+    'project_score': (ProjectInfo, 'score'),
+    'project_score_quality': (ProjectInfo, 'score_quality'),
+    'project_score_schedule': (ProjectInfo, 'score_schedule'),
+    'project_score_cost': (ProjectInfo, 'score_cost'),
+    'project_score_willing_to_refer': (ProjectInfo, 'score_willing_to_refer'),
+}
+
+FLAT_COLUMNS = tuple(FLAT_COLUMN_SOURCES)
+
+
+def _source_attributes(source: type) -> tuple:
+    return tuple(attribute for cls, attribute in FLAT_COLUMN_SOURCES.values() if cls is source)
+
+
+def _tuple_getter(attributes: tuple):
+    # attrgetter returns a bare value for a single attribute; always hand back a tuple
+    getter = attrgetter(*attributes)
+    return getter if len(attributes) > 1 else lambda obj: (getter(obj),)
+
+
+_FLAT_SOURCE_ORDER = (ScrapedData, CompetitorInfo, ReviewerInfo, ProjectInfo)
+
+# Rows are the record, competitor, reviewer and project values concatenated, so each
+# source's columns have to sit together and in that order
+if FLAT_COLUMNS != tuple(
+    column
+    for source in _FLAT_SOURCE_ORDER
+    for column, (cls, _) in FLAT_COLUMN_SOURCES.items()
+    if cls is source
+):
+    raise ValueError("FLAT_COLUMN_SOURCES must group columns by source: record, competitor, reviewer, project")
+
+_RECORD_VALUES = _tuple_getter(_source_attributes(ScrapedData))
+_COMPETITOR_VALUES = _tuple_getter(_source_attributes(CompetitorInfo))
+_REVIEWER_VALUES = _tuple_getter(_source_attributes(ReviewerInfo))
+_PROJECT_VALUES = _tuple_getter(_source_attributes(ProjectInfo))
+_EMPTY_COMPETITOR_VALUES = (None,) * len(_source_attributes(CompetitorInfo))
+_EMPTY_REVIEWER_TAIL = (None,) * (len(_source_attributes(ReviewerInfo)) + len(_source_attributes(ProjectInfo)))
+
+
+def _flat_cell(value: Any) -> Any:
+    # List fields (competitor locations) become one comma-separated cell, empty ones None
+    if isinstance(value, list):
+        return ', '.join(value) if value else None
+    return value
+
+
+def _build_flat_rows(record: ScrapedData) -> List[tuple]:
+    competitor = record.competitor
+    head = _RECORD_VALUES(record) + (
+        tuple(map(_flat_cell, _COMPETITOR_VALUES(competitor))) if competitor else _EMPTY_COMPETITOR_VALUES
+    )
+
+    if not record.reviewers:
+        return [head + _EMPTY_REVIEWER_TAIL]
+
+    return [
+        head + _REVIEWER_VALUES(reviewer) + _PROJECT_VALUES(reviewer.project or _EMPTY_PROJECT)
+        for reviewer in record.reviewers
+    ]
 
 
 class DataExporter:
@@ -131,8 +255,23 @@ class DataExporter:
     def export_to_json(data: List[ScrapedData], filename: str) -> None:
         json_data = [item.to_dict() for item in data]
 
+        # Encode in one go and write once; json.dump writes many small iterencode chunks
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(json_data, indent=2, ensure_ascii=False))
+
+        print(f"Exported {len(data)} records to {filename}")
+
+    @staticmethod
+    def export_to_jsonl(data: List[ScrapedData], filename: str) -> None:
+        # One record per line, so neither writing nor reading needs the whole dataset in memory
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            for item in data:
+                f.write(json.dumps(item.to_dict(), ensure_ascii=False))
+                f.write('\n')
 
         print(f"Exported {len(data)} records to {filename}")
 
@@ -142,24 +281,19 @@ class DataExporter:
             print("No data to export")
             return
 
-        all_rows = []
-        for item in data:
-            all_rows.extend(item.to_flat_dict_list())
+        row_count = 0
 
-        if not all_rows:
-            print("No data to export")
-            return
-
-        fieldnames = all_rows[0].keys()
-
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        # Write each company's rows as they are produced rather than collecting them all first
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(FLAT_COLUMNS)
 
-            for row in all_rows:
-                writer.writerow(row)
+            for item in data:
+                rows = item.to_flat_rows()
+                writer.writerows(rows)
+                row_count += len(rows)
 
-        print(f"Exported {len(all_rows)} rows from {len(data)} companies to {filename}")
+        print(f"Exported {row_count} rows from {len(data)} companies to {filename}")
 
 
 DEVELOPMENT_SUBCATEGORIES = {
@@ -195,11 +329,13 @@ DEVELOPMENT_SUBCATEGORIES = {
 }
 
 
+# Subcategory name -> listing URL, inverted once at import
+SUBCATEGORY_URLS = {name: url for url, name in DEVELOPMENT_SUBCATEGORIES.items()}
+
+
 def get_subcategory_urls() -> Dict[str, str]:
-    urls = {}
-    for url, name in DEVELOPMENT_SUBCATEGORIES.items():
-        urls[name] = url
-    return urls
+    # A copy, so callers can't modify the shared table
+    return dict(SUBCATEGORY_URLS)
 
 
 if __name__ == "__main__":
@@ -4,19 +4,124 @@ import logging
 from typing import List, Optional, Dict, Generator
 from bs4 import BeautifulSoup, Tag
 import re
+import soupsieve as sv
+import sys
 from urllib.parse import urljoin, urlparse
 import time
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
 
-from models import ScrapedData, CompetitorInfo, ReviewerInfo, ProjectInfo, DEVELOPMENT_SUBCATEGORIES
+from models import ScrapedData, CompetitorInfo, ReviewerInfo, ProjectInfo, DEVELOPMENT_SUBCATEGORIES, shared_timestamp
 from utils import SessionManager, DataCleaner, retry, validate_url, extract_company_id_from_url, parse_pagination_info
 
+# libxml2-backed parser; much faster than the pure-Python html.parser on large profile pages
+HTML_PARSER = 'lxml'
+
+# Listing-page selectors for company entries, tried in order; compiled once at import
+_COMPANY_SELECTORS = tuple((selector, sv.compile(selector)) for selector in (
+    'li[itemtype="https://schema.org/Organization"]',  # Main provider items
+    '.providers__list li',  # Provider list items
+    'li[class*="provider"]',  # Any li with provider in class
+    'div[class*="provider"]',  # Any div with provider in class
+    'li[itemscope]',  # Schema.org marked items
+    '.company-tile',
+    '.provider-card'
+))
+
+# All company selectors as one selector list, so a page is walked once for every candidate
+_COMPANY_SELECTOR_UNION = sv.compile(', '.join(selector for selector, _ in _COMPANY_SELECTORS))
+
+_COMPANY_NAME_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'h2 a', 'h3 a', 'h4 a',  # Header with link
+    '.company-name a', '.provider-name a',  # Class-based
+    'a[href*="/profile/"]'  # Profile link
+))
+
+_PROFILE_LINK_SELECTOR = sv.compile('a[href*="/profile/"]')
+_REVIEW_SELECTOR = sv.compile('.profile-review')
+_REVIEW_DATA_SELECTOR = sv.compile('.profile-review__data')
+_REVIEW_CONTENT_SELECTOR = sv.compile('.profile-review__content')
+_REVIEW_REVIEWER_SELECTOR = sv.compile('.profile-review__reviewer')
+_REVIEW_RATING_SELECTOR = sv.compile('.profile-review__rating-metrics')
+_ADDRESS_SELECTOR = sv.compile('.detailed-address.location_element')
+
+# Patterns used by the page parsing methods, compiled once at import
+# Listing location text, tried in order: "City, ST", then "City, Country"
+_LOCATION_TEXT_RES = (
+    re.compile(r'[A-Z][a-z]+,\s*[A-Z]{2}'),
+    re.compile(r'[A-Z][a-z]+,\s*[A-Z][a-z]+'),
+)
+# A bare "City, X"; the text node fallback needs one inside a single string
+_LOCATION_STRING_RE = re.compile(r'[A-Z][a-z]+,\s*[A-Z]')
+# Words suggesting a generic element is a company card (fallback listing detection)
+_COMPANY_INDICATOR_RE = re.compile(r'reviews|rating|stars|location|employees|founded|services', re.IGNORECASE)
+_LOCATION_SPLIT_RE = re.compile(r'[;|]|\sand\s')
+# Review date ranges, tried in order: "Mon YYYY - Mon YYYY|Ongoing", then "Mon - Mon YYYY"
+_DATE_RANGE_RES = (
+    re.compile(r'([A-Za-z]{3,9}\.?\s+\d{4})\s*[-–]\s*([A-Za-z]{3,9}\.?\s+\d{4}|Ongoing)'),
+    re.compile(r'([A-Za-z]{3,9})\s*[-–]\s*([A-Za-z]{3,9}\.?\s+\d{4})'),
+)
+_BUDGET_RE = re.compile(r'\$([0-9,]+(?:\s*to\s*\$[0-9,]+)?)')
+# Overall score, by preference: "4.5 Overall/Quality/Rating", then "4.5/5", then "4.5 stars"
+_SCORE_RE = re.compile(
+    r'(?P<score>\d+\.?\d*)(?:\s*(?P<labelled>Quality|Overall|Rating)|(?P<out_of_five>/5)|\s*(?P<stars>stars?))',
+    re.IGNORECASE
+)
+_SCORE_FORMS = ('labelled', 'out_of_five', 'stars')
+# "City, ST" within one line of address text, and markers of address lines that aren't a city
+_CITY_STATE_RE = re.compile(r'([A-Z][a-zA-Z .\-]*?)[ \t]*,[ \t]*([A-Z]{2})\b')
+_NOT_CITY_RE = re.compile(r',|United States|CA|NY|TX|(?i:suite|blvd)')
+_EMP_RE = re.compile(r'\d+(?:-\d+)?\s*employees?', re.IGNORECASE)
+# Industry keywords in reviewer details ("Information technology" and "Other Industry"
+# are covered by "technology" and "industry")
+_INDUSTRY_RE = re.compile(
+    r'industry|technology|consulting|automotive|healthcare|finance|marketing|non-?profit'
+    r'|education|retail|manufacturing|consumer products|social networking',
+    re.IGNORECASE
+)
+_REVIEWER_LOCATION_RES = (
+    re.compile(r'^([A-Za-z\s]+),\s+([A-Za-z\s]+)$'),  # City, State (allow mixed case)
+    re.compile(r'^([A-Za-z\s]+)$'),  # Just city or state (allow mixed case)
+)
+_NAME_RES = (
+    re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)'),  # First Last
+    re.compile(r'([A-Z][a-z]+)'),  # Single name
+)
+# Data-list entries that are not services, and reviewer-list entries that are only badges
+_SERVICE_SKIP_WORDS = ('confidential', 'ongoing', '2022', '2023', '2024', '2025')
+_REVIEWER_BADGES = frozenset({'Verified', 'Online Review', 'Phone Interview'})
+_SKIP_NAMES = frozenset({'Anonymous', 'Verified', 'Online', 'Review', 'Phone', 'Interview'})
+
+# Per-company state while deduplicating: the record with the most reviewers, the merged
+# reviewer list with the signatures already in it, and how many records were seen
+@dataclass(slots=True)
+class _CompanyGroup:
+    best: ScrapedData
+    review_count: int
+    reviewers: List[ReviewerInfo] = field(default_factory=list)
+    signatures: set = field(default_factory=set)
+    count: int = 0
+
 class ClutchScraper:
-    def __init__(self, max_pages_per_category: int = 5, max_companies_per_page: int = 20):
-        self.session_manager = SessionManager()
+    def __init__(self, max_pages_per_category: int = 5, max_companies_per_page: int = 20,
+                 max_concurrent_requests: Optional[int] = None, http_cache_path: Optional[str] = None,
+                 min_delay: float = 3.0, max_delay: float = 7.0):
+        self.session_manager = SessionManager(cache_path=http_cache_path, min_delay=min_delay, max_delay=max_delay)
         self.data_cleaner = DataCleaner()
         self.max_pages_per_category = max_pages_per_category
         self.max_companies_per_page = max_companies_per_page
+
+        # Fetch workers beyond the limiter's burst only queue on it, so cap the pool there;
+        # with pacing disabled the caller's value (or the burst size by default) is used as is
+        rate_limiter = self.session_manager.rate_limiter
+        if max_concurrent_requests is None:
+            max_concurrent_requests = rate_limiter.capacity
+        if rate_limiter.rate is not None:
+            max_concurrent_requests = min(max_concurrent_requests, rate_limiter.capacity)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+
         self.max_reviews_per_company = 10
         self.scraped_data: List[ScrapedData] = []
 
@@ -48,45 +153,77 @@ class ClutchScraper:
 
     def scrape_category(self, category_url: str, subcategory_name: str) -> List[ScrapedData]:
         
-        category_data = []
+        return list(self.iter_category(category_url, subcategory_name))
+
+    def iter_category(self, category_url: str, subcategory_name: str) -> Generator[ScrapedData, None, None]:
+        
+        # Yields each listing page's records as soon as the page is done, so callers can
+        # export or dedupe incrementally instead of waiting for the whole category
         current_url = category_url
         page_count = 0
 
         while current_url and page_count < self.max_pages_per_category:
-            try:
-                page_count += 1
-                logging.info(f"Scraping page {page_count} of {subcategory_name}: {current_url}")
+            page_count += 1
+            logging.info(f"Scraping page {page_count} of {subcategory_name}: {current_url}")
 
-                response = self.session_manager.get(current_url)
-                if not response:
-                    logging.warning(f"Failed to get response for {current_url}")
-                    break
+            # The session and pagination helpers handle their own failures; only parsing can raise here
+            response = self.session_manager.get(current_url)
+            if not response:
+                logging.warning(f"Failed to get response for {current_url}")
+                break
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+            try:
+                soup = self._make_soup(response)
+            except Exception as e:
+                logging.error(f"Error scraping page {current_url}: {e}")
+                break
 
+            # Records from one listing page share a single scraped_at timestamp
+            with shared_timestamp():
                 companies = self.extract_companies_from_page(soup, subcategory_name, current_url)
-                category_data.extend(companies)
 
-                pagination_info = parse_pagination_info(soup)
-                current_url = pagination_info['next_url'] if pagination_info['has_next'] else None
+            pagination_info = parse_pagination_info(soup)
+            current_url = pagination_info['next_url'] if pagination_info['has_next'] else None
 
-            except Exception as e:
-                logging.error(f"Error scraping page {current_url}: {e}")
-                break
+            yield from companies
+
+    def _make_soup(self, response) -> BeautifulSoup:
+        
+        # A charset declared in the headers spares bs4 from sniffing the encoding itself
+        content_type = response.headers.get('Content-Type', '')
+        encoding = response.encoding if 'charset=' in content_type.lower() else None
+
+        soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=encoding)
 
-        return category_data
+        # The tree holds everything needed from here on; release the raw body and connection
+        response.close()
+        return soup
 
     def extract_companies_from_page(self, soup: BeautifulSoup, subcategory_name: str, page_url: str) -> List[ScrapedData]:
         
         companies_data = []
 
-        company_elements = self._find_company_elements(soup)
+        try:
+            company_elements = self._find_company_elements(soup)
+        except Exception as e:
+            logging.error(f"Error finding company elements on {page_url}: {e}")
+            return companies_data
 
         logging.info(f"Found {len(company_elements)} company elements on page")
 
-        for i, company_element in enumerate(company_elements[:self.max_companies_per_page]):
-            try:
-                company_info = self._extract_company_basic_info(company_element)
+        # Company profiles are fetched concurrently (the session's rate limiter still spaces
+        # out request starts); results are collected in page order
+        pending = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            for i, company_element in enumerate(company_elements[:self.max_companies_per_page]):
+                # One malformed listing element shouldn't cost the rest of the page
+                try:
+                    company_info = self._extract_company_basic_info(company_element)
+                except Exception as e:
+                    logging.error(f"Error processing company element {i}: {e}")
+                    continue
+
+                # Elements without a company name come back as None
                 if not company_info:
                     continue
 
@@ -94,8 +231,8 @@ class ClutchScraper:
 
                 company_url = company_info.get('url')
                 if company_url:
-                    detailed_data = self.scrape_company_details(company_url, subcategory_name)
-                    companies_data.extend(detailed_data)
+                    # Workers run in a copy of this context so they see the page's shared timestamp
+                    pending.append((i, executor.submit(copy_context().run, self.scrape_company_details, company_url, subcategory_name)))
                 else:
 
                     basic_record = ScrapedData(
@@ -106,30 +243,25 @@ class ClutchScraper:
                         ),
                         source_url=page_url
                     )
-                    companies_data.append(basic_record)
+                    pending.append((i, [basic_record]))
 
-            except Exception as e:
-                logging.error(f"Error processing company element {i}: {e}")
-                continue
+            for i, result in pending:
+                try:
+                    companies_data.extend(result.result() if isinstance(result, Future) else result)
+                except Exception as e:
+                    logging.error(f"Error processing company element {i}: {e}")
 
         return companies_data
 
     def _find_company_elements(self, soup: BeautifulSoup) -> List[Tag]:
 
-        selectors = [
-            'li[itemtype="https://schema.org/Organization"]',  # Main provider items
-            '.providers__list li',  # Provider list items
-            'li[class*="provider"]',  # Any li with provider in class
-            'div[class*="provider"]',  # Any div with provider in class
-            'li[itemscope]',  # Schema.org marked items
-            '.company-tile',
-            '.provider-card'
-        ]
-
         company_elements = []
 
-        for selector in selectors:
-            elements = soup.select(selector)
+        # Walk the page once, then pick the highest-priority selector among the candidates
+        candidates = _COMPANY_SELECTOR_UNION.select(soup)
+
+        for selector, compiled in _COMPANY_SELECTORS if candidates else ():
+            elements = [element for element in candidates if compiled.match(element)]
             if elements:
                 logging.info(f"Found {len(elements)} elements with selector: {selector}")
                 company_elements = elements
@@ -147,69 +279,51 @@ class ClutchScraper:
 
     def _looks_like_company_element(self, element: Tag) -> bool:
         
-        text = element.get_text(strip=True).lower()
-
-        company_indicators = [
-            'reviews',
-            'rating',
-            'stars',
-            'location',
-            'employees',
-            'founded',
-            'services'
-        ]
+        text = element.get_text(strip=True)
 
-        indicator_count = sum(1 for indicator in company_indicators if indicator in text)
+        indicators_found = set()
+        for match in _COMPANY_INDICATOR_RE.finditer(text):
+            indicators_found.add(match.group(0).lower())
+            if len(indicators_found) >= 2:
+                return True
 
-        has_profile_link = bool(element.find('a', href=lambda x: x and '/profile/' in x))
-
-        return indicator_count >= 2 or has_profile_link
+        return _PROFILE_LINK_SELECTOR.select_one(element) is not None
 
     def _extract_company_basic_info(self, element: Tag) -> Optional[Dict]:
         
-        try:
-            company_info = {}
-
-            name_selectors = [
-                'h2 a', 'h3 a', 'h4 a',  # Header with link
-                '.company-name a', '.provider-name a',  # Class-based
-                'a[href*="/profile/"]'  # Profile link
-            ]
-
-            name_element = None
-            for selector in name_selectors:
-                name_element = element.select_one(selector)
-                if name_element:
-                    break
+        company_info = {}
 
+        name_element = None
+        for selector in _COMPANY_NAME_SELECTORS:
+            name_element = selector.select_one(element)
             if name_element:
-                company_info['name'] = self.data_cleaner.clean_text(name_element.get_text())
-                company_info['url'] = urljoin('https://clutch.co', name_element.get('href', ''))
+                break
 
-            location_text = self._extract_location_text(element)
-            if location_text:
-                company_info['locations'] = self._parse_locations(location_text)
+        if name_element:
+            company_info['name'] = self.data_cleaner.clean_text(name_element.get_text())
+            company_info['url'] = urljoin('https://clutch.co', name_element.get('href', ''))
 
-            return company_info if company_info.get('name') else None
+        location_text = self._extract_location_text(element)
+        if location_text:
+            company_info['locations'] = self._parse_locations(location_text)
 
-        except Exception as e:
-            logging.error(f"Error extracting company basic info: {e}")
-            return None
+        return company_info if company_info.get('name') else None
 
     def _extract_location_text(self, element: Tag) -> Optional[str]:
 
-        location_patterns = [
-            r'[A-Z][a-z]+,\s*[A-Z]{2}',  # City, State
-            r'[A-Z][a-z]+,\s*[A-Z][a-z]+',  # City, Country
-        ]
-
+        # Each form is searched over the whole text in turn, so a "City, Country" match
+        # can't swallow a "City, ST" that overlaps it
         text = element.get_text()
-        for pattern in location_patterns:
-            match = re.search(pattern, text)
+        for pattern in _LOCATION_TEXT_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
 
-        location_element = element.find(string=re.compile(r'[A-Z][a-z]+,\s*[A-Z]'))
+        # A text node can only match if the joined text does, so skip the walk otherwise
+        if not _LOCATION_STRING_RE.search(text):
+            return None
+
+        location_element = element.find(string=_LOCATION_STRING_RE)
         return location_element.strip() if location_element else None
 
     def _parse_locations(self, location_text: str) -> List[str]:
@@ -217,7 +331,7 @@ class ClutchScraper:
         if not location_text:
             return []
 
-        locations = re.split(r'[;|]|\sand\s', location_text)
+        locations = _LOCATION_SPLIT_RE.split(location_text)
         return [self.data_cleaner.clean_text(loc) for loc in locations if loc.strip()]
 
     @retry(max_attempts=3, delay=2.0)
@@ -231,12 +345,14 @@ class ClutchScraper:
         if not response:
             return []
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._make_soup(response)
 
         company_info = self._extract_detailed_company_info(soup)
 
+        # The #reviews fragment never reaches the server, so the reviews are on the page
+        # already fetched; parse them from the same soup instead of downloading it again
         reviews_url = f"{company_url}#reviews"
-        reviewers = self._scrape_reviews_from_page(reviews_url)
+        reviewers = self._extract_reviews(soup)
 
         record = ScrapedData(
             subcategory=subcategory_name,
@@ -251,15 +367,6 @@ class ClutchScraper:
 
         return [record]
 
-    def _scrape_reviews_from_page(self, reviews_url: str) -> List[ReviewerInfo]:
-        
-        response = self.session_manager.get(reviews_url)
-        if not response:
-            return []
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return self._extract_reviews(soup)
-
     def _extract_detailed_company_info(self, soup: BeautifulSoup) -> Dict:
         
         company_info = {}
@@ -270,29 +377,22 @@ class ClutchScraper:
             if name_element:
                 company_info['name'] = self.data_cleaner.clean_text(name_element.get_text())
 
-            location_elements = soup.select('.detailed-address.location_element')
+            location_elements = _ADDRESS_SELECTOR.select(soup)
             if location_elements:
                 locations = []
                 for loc_elem in location_elements[:3]:
-                    location_parts = []
-
-                    spans = loc_elem.find_all('span')
-                    city = None
-                    state = None
-                    country = None
-
-                    for span in spans:
-                        span_text = self._clean_text(span.get_text())
-                        if span_text and len(span_text) > 1:
-                            if not city and not any(c in span_text for c in [',', 'United States', 'CA', 'NY', 'TX']):
-                                if not span_text.isdigit() and 'suite' not in span_text.lower() and 'blvd' not in span_text.lower():
-                                    city = span_text
-                            elif ', ' in span_text and not state:
-                                parts = span_text.split(', ')
-                                if len(parts) >= 2 and len(parts[1]) == 2:
-                                    if not city:
-                                        city = parts[0]
-                                    state = parts[1]
+                    # One scan of the address text for "City, ST"; address parts stay on
+                    # separate lines so the city can't run into a neighbouring span
+                    address_text = loc_elem.get_text('\n')
+                    match = _CITY_STATE_RE.search(address_text)
+                    if match:
+                        city, state = ' '.join(match.group(1).split()), match.group(2)
+                    else:
+                        state = None
+                        city = next((
+                            line for line in map(self._clean_text, address_text.split('\n'))
+                            if len(line) > 1 and not _NOT_CITY_RE.search(line) and not line.isdigit()
+                        ), None)
 
                     if city and state:
                         location_str = f"{city}, {state}"
@@ -316,24 +416,25 @@ class ClutchScraper:
 
         try:
 
-            review_data_elements = soup.select('.profile-review__data')
-            review_content_elements = soup.select('.profile-review__content')
-            review_reviewer_elements = soup.select('.profile-review__reviewer')
-            review_rating_elements = soup.select('.profile-review__rating-metrics')
+            # One walk over the review cards; each card's parts are looked up inside it, so
+            # a card missing a part can't shift the pairing of the cards after it
+            review_elements = _REVIEW_SELECTOR.select(soup)
 
-            logging.info(f"Found {len(review_data_elements)} review data, {len(review_content_elements)} content, {len(review_reviewer_elements)} reviewer elements, {len(review_rating_elements)} rating metrics")
+            logging.info(f"Found {len(review_elements)} review elements")
 
-            num_reviews = min(len(review_data_elements), len(review_content_elements), len(review_reviewer_elements))
-            num_reviews = min(num_reviews, self.max_reviews_per_company)
-
-            for i in range(num_reviews):
+            for i, review_elem in enumerate(review_elements[:self.max_reviews_per_company]):
                 try:
-                    rating_elem = review_rating_elements[i] if i < len(review_rating_elements) else None
+                    data_elem = _REVIEW_DATA_SELECTOR.select_one(review_elem)
+                    content_elem = _REVIEW_CONTENT_SELECTOR.select_one(review_elem)
+                    reviewer_elem = _REVIEW_REVIEWER_SELECTOR.select_one(review_elem)
+                    if not (data_elem and content_elem and reviewer_elem):
+                        continue
+
                     reviewer = self._extract_single_clutch_review(
-                        review_data_elements[i],
-                        review_content_elements[i],
-                        review_reviewer_elements[i],
-                        rating_elem
+                        data_elem,
+                        content_elem,
+                        reviewer_elem,
+                        _REVIEW_RATING_SELECTOR.select_one(review_elem)
                     )
                     if reviewer:
                         reviewers.append(reviewer)
@@ -348,110 +449,90 @@ class ClutchScraper:
 
     def _extract_single_clutch_review(self, data_elem: Tag, content_elem: Tag, reviewer_elem: Tag, rating_elem: Optional[Tag] = None) -> Optional[ReviewerInfo]:
         
-        try:
-            reviewer = ReviewerInfo()
-            project = ProjectInfo()
-
-            if data_elem:
-                data_text = self._clean_text(data_elem.get_text())
+        reviewer = ReviewerInfo()
+        project = ProjectInfo()
 
-                services = []
-                for li in data_elem.find_all('li'):
-                    service_text = self._clean_text(li.get_text())
-                    if service_text and not any(skip in service_text.lower() for skip in ['confidential', 'ongoing', '2022', '2023', '2024', '2025']):
-                        services.append(service_text)
+        if data_elem:
+            data_text = self._clean_text(data_elem.get_text())
 
-                if services:
-                    project.service_provided = ', '.join(services[:3])  # Take first 3 services
+            services = []
+            for li in data_elem.find_all('li'):
+                service_text = self._clean_text(li.get_text())
+                lowered = service_text.lower()
+                if service_text and not any(skip in lowered for skip in _SERVICE_SKIP_WORDS):
+                    services.append(service_text)
 
-                date_patterns = [
-                    r'([A-Za-z]{3,9}\.?\s+\d{4})\s*[-–]\s*([A-Za-z]{3,9}\.?\s+\d{4}|Ongoing)',
-                    r'([A-Za-z]{3,9})\s*[-–]\s*([A-Za-z]{3,9}\.?\s+\d{4})',
-                ]
+            if services:
+                project.service_provided = ', '.join(services[:3])  # Take first 3 services
 
-                for pattern in date_patterns:
-                    match = re.search(pattern, data_text)
-                    if match:
-                        project.start_date = match.group(1).strip()
-                        project.end_date = match.group(2).strip()
-                        break
-
-                budget_pattern = r'\$([0-9,]+(?:\s*to\s*\$[0-9,]+)?)'
-                match = re.search(budget_pattern, data_text)
+            # A full range anywhere in the text beats the short form, so search them in turn
+            for pattern in _DATE_RANGE_RES:
+                match = pattern.search(data_text)
                 if match:
-                    project.project_size = f"${match.group(1)}"
-
-            if content_elem:
-                content_text = self._clean_text(content_elem.get_text())
-
-                score_patterns = [
-                    r'(\d+\.?\d*)\s*(?:Quality|Overall|Rating)',
-                    r'(\d+\.?\d*)/5',
-                    r'(\d+\.?\d*)\s*stars?',
-                ]
-
-                for pattern in score_patterns:
-                    match = re.search(pattern, content_text, re.IGNORECASE)
-                    if match:
-                        try:
-                            project.score = float(match.group(1))
-                            break
-                        except ValueError:
-                            continue
+                    project.start_date = match.group(1).strip()
+                    project.end_date = match.group(2).strip()
+                    break
 
-            if rating_elem:
-                try:
-                    dl_elements = rating_elem.find_all('dl')
-                    for dl in dl_elements:
-                        dt = dl.find('dt')
-                        dd = dl.find('dd')
-                        if dt and dd:
-                            metric_name = self._clean_text(dt.get_text()).lower()
-                            metric_value = self._clean_text(dd.get_text())
-                            try:
-                                score_value = float(metric_value)
-                                if 'quality' in metric_name:
-                                    project.score_quality = score_value
-                                elif 'schedule' in metric_name:
-                                    project.score_schedule = score_value
-                                elif 'cost' in metric_name:
-                                    project.score_cost = score_value
-                                elif 'willing to refer' in metric_name or 'refer' in metric_name:
-                                    project.score_willing_to_refer = score_value
-                            except ValueError:
-                                continue
-                except Exception as e:
-                    logging.warning(f"Error extracting rating metrics: {e}")
+            match = _BUDGET_RE.search(data_text)
+            if match:
+                project.project_size = f"${match.group(1)}"
+
+        if content_elem:
+            content_text = self._clean_text(content_elem.get_text())
+
+            # One scan for all score forms, keeping the first match of the preferred form
+            best_match = None
+            best_rank = len(_SCORE_FORMS)
+            for match in _SCORE_RE.finditer(content_text):
+                rank = _SCORE_FORMS.index(match.lastgroup)
+                if rank < best_rank:
+                    best_match, best_rank = match, rank
+                    if rank == 0:
+                        break
 
-            if reviewer_elem:
+            if best_match:
+                project.score = float(best_match.group('score'))
+
+        if rating_elem:
+            for dl in rating_elem.find_all('dl'):
+                dt = dl.find('dt')
+                dd = dl.find('dd')
+                if dt and dd:
+                    metric_name = self._clean_text(dt.get_text()).lower()
+                    # Only the number conversion can fail; skip metrics that aren't numeric
+                    try:
+                        score_value = float(self._clean_text(dd.get_text()))
+                    except ValueError:
+                        continue
+                    if 'quality' in metric_name:
+                        project.score_quality = score_value
+                    elif 'schedule' in metric_name:
+                        project.score_schedule = score_value
+                    elif 'cost' in metric_name:
+                        project.score_cost = score_value
+                    elif 'willing to refer' in metric_name or 'refer' in metric_name:
+                        project.score_willing_to_refer = score_value
 
-                reviewer_text = self._clean_text(reviewer_elem.get_text())
+        if reviewer_elem:
 
-                self._parse_reviewer_info(reviewer, reviewer_text, reviewer_elem)
+            reviewer_text = self._clean_text(reviewer_elem.get_text())
 
-            reviewer.project = project
+            self._parse_reviewer_info(reviewer, reviewer_text, reviewer_elem)
 
-            if reviewer.name or reviewer.company or project.service_provided or project.score:
-                return reviewer
+        reviewer.project = project
 
-            return None
+        if reviewer.name or reviewer.company or project.service_provided or project.score:
+            return reviewer
 
-        except Exception as e:
-            logging.error(f"Error extracting Clutch review: {e}")
-            return None
+        return None
 
     def _clean_text(self, text: str) -> str:
         
         if not text:
             return ""
 
-        cleaned = re.sub(r'\s+', ' ', text)
-
-        cleaned = re.sub(r'\t+', ' ', cleaned)
-
-        cleaned = cleaned.strip()
-
-        return cleaned
+        # split() both trims and collapses whitespace runs in a single C-level pass
+        return ' '.join(text.split())
 
     def _parse_reviewer_info(self, reviewer: ReviewerInfo, reviewer_text: str, reviewer_elem: Tag):
         
@@ -486,164 +567,79 @@ class ClutchScraper:
                 for li in li_elements:
                     li_text = self._clean_text(li.get_text())
 
-                    if li_text in ['Verified', 'Online Review', 'Phone Interview']:
+                    if li_text in _REVIEWER_BADGES:
                         continue
 
-                    if re.search(r'\d+(?:-\d+)?\s*employees?', li_text, re.IGNORECASE):
-                        reviewer.company_size = li_text
+                    # Size brackets and industries repeat across thousands of reviewers;
+                    # intern them so every reviewer shares one copy of each value
+                    if _EMP_RE.search(li_text):
+                        reviewer.company_size = sys.intern(li_text)
                         continue
 
-                    industries = [
-                        'Industry', 'Technology', 'Consulting', 'Automotive', 'Healthcare',
-                        'Finance', 'Marketing', 'Non-profit', 'Nonprofit', 'Education',
-                        'Retail', 'Manufacturing', 'Information technology', 'Consumer Products',
-                        'Social Networking', 'Other Industry'
-                    ]
-                    is_industry = False
-                    for industry in industries:
-                        if industry.lower() in li_text.lower():
-                            reviewer.industry = li_text
-                            is_industry = True
-                            break
-
-                    if is_industry:
+                    if _INDUSTRY_RE.search(li_text):
+                        reviewer.industry = sys.intern(li_text)
                         continue
 
-                    location_patterns = [
-                        r'^([A-Za-z\s]+),\s+([A-Za-z\s]+)$',  # City, State (allow mixed case)
-                        r'^([A-Za-z\s]+)$',  # Just city or state (allow mixed case)
-                    ]
-                    for pattern in location_patterns:
-                        if re.match(pattern, li_text) and len(li_text) < 50:
+                    for pattern in _REVIEWER_LOCATION_RES:
+                        if pattern.match(li_text) and len(li_text) < 50:
                             reviewer.location = li_text
                             break
 
             if not reviewer.name and not name_found:
 
-                name_patterns = [
-                    r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # First Last
-                    r'([A-Z][a-z]+)',  # Single name
-                ]
-                skip_names = ['Anonymous', 'Verified', 'Online', 'Review', 'Phone', 'Interview']
+                skip_names = _SKIP_NAMES
                 if reviewer.company:
 
-                    skip_names.extend(reviewer.company.split())
+                    skip_names = skip_names.union(reviewer.company.split())
 
-                for pattern in name_patterns:
-                    matches = re.findall(pattern, reviewer_text)
-                    for match in matches:
-                        if match not in skip_names:
-                            reviewer.name = match
-                            break
-                    if reviewer.name:
+                # Stop at the first acceptable match instead of collecting every candidate
+                for pattern in _NAME_RES:
+                    name = next(
+                        (match.group(1) for match in pattern.finditer(reviewer_text)
+                         if match.group(1) not in skip_names),
+                        None
+                    )
+                    if name:
+                        reviewer.name = name
                         break
 
         except Exception as e:
             logging.warning(f"Error parsing reviewer info: {e}")
 
-    def _extract_single_review(self, element: Tag) -> Optional[ReviewerInfo]:
-        
-        try:
-            reviewer = ReviewerInfo()
-            project = ProjectInfo()
-
-            name_element = element.find('strong') or element.find('h3') or element.find('h4')
-            if name_element:
-                reviewer.name = self.data_cleaner.clean_text(name_element.get_text())
-
-            text = element.get_text()
-
-            title_company_pattern = r'([^,]+),\s*([^,]+)\s+at\s+([^,\n]+)'
-            match = re.search(title_company_pattern, text)
-            if match:
-                reviewer.job_title = self.data_cleaner.clean_text(match.group(2))
-                reviewer.company = self.data_cleaner.clean_text(match.group(3))
-
-            industry_pattern = r'Industry:\s*([^\n]+)'
-            match = re.search(industry_pattern, text)
-            if match:
-                reviewer.industry = self.data_cleaner.clean_text(match.group(1))
-
-            size_pattern = r'(\d+[-\s]*\d*\s*employees?)'
-            match = re.search(size_pattern, text, re.IGNORECASE)
-            if match:
-                reviewer.company_size = self.data_cleaner.parse_employee_count(match.group(1))
-
-            service_pattern = r'Service[s]?:\s*([^\n]+)'
-            match = re.search(service_pattern, text)
-            if match:
-                project.service_provided = self.data_cleaner.clean_text(match.group(1))
-
-            budget_pattern = r'\$[\d,]+(?:\s*[-–]\s*\$[\d,]+)?'
-            match = re.search(budget_pattern, text)
-            if match:
-                project.project_size = match.group(0)
-
-            date_text = text
-            start_date, end_date = self.data_cleaner.parse_date_range(date_text)
-            project.start_date = start_date
-            project.end_date = end_date
-
-            rating_element = element.find(string=re.compile(r'\d+\.?\d*\s*(?:out of|/)\s*\d+'))
-            if rating_element:
-                project.score = self.data_cleaner.extract_number_from_text(rating_element)
-
-            reviewer.project = project
-
-            if reviewer.name or reviewer.company or project.service_provided:
-                return reviewer
-
-            return None
-
-        except Exception as e:
-            logging.error(f"Error extracting single review: {e}")
-            return None
-
     def _deduplicate_companies(self, data: List[ScrapedData]) -> List[ScrapedData]:
         
         if not data:
             return data
 
-        company_groups = {}
+        # One pass over the records, grouping them by normalized company name
+        groups: Dict[str, _CompanyGroup] = {}
         for record in data:
-            company_name = record.competitor.name if record.competitor else None
-            if not company_name:
+            normalized_name = record.competitor.dedup_key() if record.competitor else None
+            if normalized_name is None:
                 continue
 
-            normalized_name = company_name.lower().strip()
+            review_count = len(record.reviewers) if record.reviewers else 0
+            group = groups.get(normalized_name)
+            if group is None:
+                group = groups[normalized_name] = _CompanyGroup(record, review_count)
+            elif review_count > group.review_count:
+                group.best, group.review_count = record, review_count
 
-            if normalized_name not in company_groups:
-                company_groups[normalized_name] = []
-            company_groups[normalized_name].append(record)
+            for reviewer in record.reviewers or ():
+                signature = reviewer.dedup_key()
+                if signature not in group.signatures:
+                    group.signatures.add(signature)
+                    group.reviewers.append(reviewer)
+            group.count += 1
 
         deduplicated = []
-        for company_name, records in company_groups.items():
-            if len(records) == 1:
-                deduplicated.append(records[0])
-            else:
-
-                best_record = max(records, key=lambda r: len(r.reviewers) if r.reviewers else 0)
-
-                all_reviewers = []
-                reviewer_signatures = set()
-
-                for record in records:
-                    if record.reviewers:
-                        for reviewer in record.reviewers:
-
-                            signature = (
-                                reviewer.name or "",
-                                reviewer.company or "",
-                                reviewer.job_title or ""
-                            )
-                            if signature not in reviewer_signatures:
-                                reviewer_signatures.add(signature)
-                                all_reviewers.append(reviewer)
+        for company_name, group in groups.items():
+            if group.count > 1:
+                group.best.reviewers = group.reviewers
 
-                best_record.reviewers = all_reviewers
-                deduplicated.append(best_record)
+                logging.info(f"Merged {group.count} instances of '{company_name}' -> {len(group.reviewers)} unique reviewers")
 
-                logging.info(f"Merged {len(records)} instances of '{company_name}' -> {len(all_reviewers)} unique reviewers")
+            deduplicated.append(group.best)
 
         return deduplicated
 
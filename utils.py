@@ -4,52 +4,162 @@ import cloudscraper
 from bs4 import BeautifulSoup
 import time
 import random
+import shelve
+import threading
 import logging
 from typing import Optional, Dict, List, Any
 import re
 from urllib.parse import urljoin, urlparse
 import json
-from functools import wraps
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+
+from config import ERROR_HANDLING_CONFIG
 
 
 class RateLimiter:
-    def __init__(self, min_delay: float = 3.0, max_delay: float = 7.0):
+    __slots__ = ('min_delay', 'max_delay', 'rate', 'capacity', 'tokens', 'last_refill', '_lock')
+
+    def __init__(self, min_delay: float = 3.0, max_delay: float = 7.0, burst: int = 3):
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.last_request = 0
+
+        # Token bucket: one token per request, refilled at the mean delay rate, so credit
+        # built up while idle lets a few requests through back to back
+        mean_delay = (min_delay + max_delay) / 2
+        self.rate = 1 / mean_delay if mean_delay > 0 else None
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
 
     def wait(self):
-        current_time = time.time()
-        time_since_last = current_time - self.last_request
+        if self.rate is None:
+            return
+
+        # Serialized so concurrent callers are spaced out rather than released together
+        with self._lock:
+            self._refill()
+
+            if self.tokens < 1:
+                # Wait out the missing credit at a randomized pace; the mean stays at the fill rate
+                sleep_time = (1 - self.tokens) * random.uniform(self.min_delay, self.max_delay)
+                logging.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+                self._refill()
+
+            self.tokens = max(0.0, self.tokens - 1)
+
+
+# Connection pool sizing for each scraping session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Initial retry delays (seconds), grown by the configured backoff multiplier per attempt
+RATE_LIMIT_BACKOFF = 30.0
+SERVER_ERROR_BACKOFF = 10.0
+REQUEST_ERROR_BACKOFF = 5.0
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    # Retry-After is either a number of seconds or an HTTP date
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
 
-        delay = random.uniform(self.min_delay, self.max_delay)
+def backoff_delay(attempt: int, base: float, retry_after: Optional[float] = None) -> Optional[float]:
+    # Seconds to wait before the next attempt, or None when retrying isn't worth it
+    max_delay = ERROR_HANDLING_CONFIG['max_backoff_delay']
 
-        if time_since_last < delay:
-            sleep_time = delay - time_since_last
-            logging.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+    # The server's own hint wins over the local schedule; retrying before it has passed
+    # would only earn another rejection, so give up if it is longer than we will wait
+    if retry_after is not None:
+        if retry_after > max_delay:
+            logging.warning(f"Retry-After of {retry_after:.0f}s exceeds the {max_delay:.0f}s backoff limit; not retrying")
+            return None
+        return retry_after
 
-        self.last_request = time.time()
+    # Exponential growth from the base delay, jittered upwards so parallel retries spread out
+    # without ever retrying sooner than the schedule allows
+    delay = base * ERROR_HANDLING_CONFIG['backoff_multiplier'] ** attempt
+    return min(random.uniform(delay, delay * 1.5), max_delay)
 
 
 class SessionManager:
-    def __init__(self, timeout: int = 30):
-        self.session = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
+    __slots__ = ('timeout', 'rate_limiter', '_local', '_sessions', '_sessions_lock', '_cache', '_cache_lock')
+
+    def __init__(self, timeout: int = 30, cache_path: Optional[str] = None,
+                 min_delay: float = 3.0, max_delay: float = 7.0):
         self.timeout = timeout
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(min_delay, max_delay)
+
+        # requests/cloudscraper sessions aren't documented as thread-safe (cookie jar and the
+        # challenge-solving state are shared mutable objects), so each fetching thread gets its
+        # own session; the rate limiter and cache stay shared across all of them
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+        # Optional on-disk cache of successful responses by URL, for development re-runs.
+        # Compression needs no setup: cloudscraper already sends Accept-Encoding.
+        self._cache = shelve.open(cache_path) if cache_path else None
+        self._cache_lock = threading.Lock()
 
         logging.info("Initialized SessionManager with cloudscraper")
 
+    @property
+    def session(self):
+        # The calling thread's session, created on first use
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'desktop': True
+                }
+            )
+
+            # Keep cloudscraper's own adapters (the https one carries its TLS cipher setup) but
+            # enlarge their connection pools so repeated fetches reuse keep-alive sockets
+            for adapter in session.adapters.values():
+                adapter.init_poolmanager(POOL_CONNECTIONS, POOL_MAXSIZE)
+
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+
+        return session
+
     def _update_headers(self):
         pass
 
     def get(self, url: str, max_retries: int = 2, **kwargs):
+        if self._cache is not None:
+            with self._cache_lock:
+                cached = self._cache.get(url)
+            if cached is not None:
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Cache hit: {url}")
+                return cached
+
         self.rate_limiter.wait()
 
         for attempt in range(max_retries + 1):
@@ -58,7 +168,12 @@ class SessionManager:
                 response = self.session.get(url, timeout=self.timeout, **kwargs)
 
                 if response.status_code == 200:
-                    logging.debug(f"✅ Success: {url} ({len(response.content)} bytes)")
+                    # Only format the per-request debug line when it will be emitted
+                    if logging.root.isEnabledFor(logging.DEBUG):
+                        logging.debug(f"✅ Success: {url} ({len(response.content)} bytes)")
+                    if self._cache is not None:
+                        with self._cache_lock:
+                            self._cache[url] = response
                     return response
                 elif response.status_code == 403:
                     logging.warning(f"Access denied (403) for {url} - cloudscraper may need update")
@@ -66,27 +181,36 @@ class SessionManager:
                 elif response.status_code == 429:
                     logging.warning(f"Rate limited (429) for {url}")
                     if attempt < max_retries:
-                        time.sleep(30)
-                        continue
+                        delay = backoff_delay(attempt, RATE_LIMIT_BACKOFF, _retry_after_seconds(response))
+                        if delay is not None:
+                            time.sleep(delay)
+                            continue
                     return None
                 else:
                     logging.warning(f"HTTP {response.status_code} for {url}")
                     if attempt < max_retries and response.status_code >= 500:
-                        time.sleep(10)
-                        continue
+                        delay = backoff_delay(attempt, SERVER_ERROR_BACKOFF, _retry_after_seconds(response))
+                        if delay is not None:
+                            time.sleep(delay)
+                            continue
                     return None
 
             except Exception as e:
                 logging.error(f"Request failed for {url}: {e}")
                 if attempt < max_retries:
-                    time.sleep(5)
+                    time.sleep(backoff_delay(attempt, REQUEST_ERROR_BACKOFF))
                     continue
                 return None
 
         return None
 
     def close(self):
-        self.session.close()
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        if self._cache is not None:
+            self._cache.close()
 
 
 def retry(max_attempts: int = 3, delay: float = 1.0):
@@ -111,13 +235,48 @@ def retry(max_attempts: int = 3, delay: float = 1.0):
     return decorator
 
 
+# Patterns used by DataCleaner and the URL helpers, compiled once at import
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+# Employee count forms as one alternation, in priority order
+_EMPLOYEE_COUNT_RE = re.compile(
+    r'(?P<employee_range>(\d+)\s*-\s*(\d+)\s*employees?)'
+    r'|(?P<employee_min>(\d+)\+?\s*employees?)'
+    r'|(?P<people_range>(\d+)\s*-\s*(\d+)\s*people)'
+    r'|(?P<people_min>(\d+)\+?\s*people)'
+)
+# Form name -> (priority, number groups)
+_EMPLOYEE_COUNT_FORMS = {
+    'employee_range': (0, (2, 3)),
+    'employee_min': (1, (5,)),
+    'people_range': (2, (7, 8)),
+    'people_min': (3, (10,)),
+}
+# A date range or a lone date in one scan; a range anywhere in the text beats a lone date
+_DATE_RE = re.compile(
+    r'(?P<start>[A-Za-z]+ \d{4})\s*[-–—]\s*(?P<end>[A-Za-z]+ \d{4})'
+    r'|(?P<single>[A-Za-z]+ \d{4})'
+)
+_MONEY_RE = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?')
+_PROFILE_ID_RE = re.compile(r'/profile/([^/?]+)')
+
+# Netloc of a plain absolute http(s) URL: printable ASCII other than '#', '/', '?', '[' and ']'
+_HTTP_NETLOC_RE = re.compile(r'https?://([ -"$-.0-9:->@-Z\\^-~]*)')
+_NETLOC_TERMINATORS = frozenset({'', '/', '?', '#'})
+
+# Case-insensitive matchers for parse_pagination_info; bs4 runs .search() on each candidate value
+_PAGINATION_CLASS_RE = re.compile('pagination', re.IGNORECASE)
+_CURRENT_CLASS_RE = re.compile('current', re.IGNORECASE)
+_NEXT_TEXT_RE = re.compile('next', re.IGNORECASE)
+
+
 class DataCleaner:
     @staticmethod
     def clean_text(text: Optional[str]) -> Optional[str]:
         if not text:
             return None
 
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        # split() drops the same Unicode whitespace that strip() and \s+ do, in C
+        cleaned = ' '.join(text.split())
 
         if not cleaned:
             return None
@@ -129,7 +288,7 @@ class DataCleaner:
         if not text:
             return None
 
-        match = re.search(r'(\d+\.?\d*)', text)
+        match = _NUMBER_RE.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -145,41 +304,35 @@ class DataCleaner:
 
         text = text.lower().strip()
 
-        patterns = [
-            r'(\d+)\s*-\s*(\d+)\s*employees?',
-            r'(\d+)\+?\s*employees?',
-            r'(\d+)\s*-\s*(\d+)\s*people',
-            r'(\d+)\+?\s*people',
-        ]
+        # One scan; the first match of the highest-priority form wins
+        best_priority, best_numbers = None, None
+        for match in _EMPLOYEE_COUNT_RE.finditer(text):
+            priority, groups = _EMPLOYEE_COUNT_FORMS[match.lastgroup]
+            if best_priority is None or priority < best_priority:
+                best_priority, best_numbers = priority, match.group(*groups)
+                if priority == 0:
+                    break
 
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                if len(match.groups()) == 2:
-                    return f"{match.group(1)}-{match.group(2)} employees"
-                else:
-                    return f"{match.group(1)}+ employees"
+        if best_numbers is None:
+            return DataCleaner.clean_text(text)
 
-        return DataCleaner.clean_text(text)
+        if isinstance(best_numbers, tuple):
+            return f"{best_numbers[0]}-{best_numbers[1]} employees"
+        return f"{best_numbers}+ employees"
 
     @staticmethod
     def parse_date_range(text: Optional[str]) -> tuple[Optional[str], Optional[str]]:
-        if not text:
+        # Every date form has a space before its year, so values like "Confidential" skip the regex
+        if not text or ' ' not in text:
             return None, None
 
-        date_pattern = r'([A-Za-z]+ \d{4})\s*[-–—]\s*([A-Za-z]+ \d{4})'
-        match = re.search(date_pattern, text)
+        single = None
+        for match in _DATE_RE.finditer(text):
+            if match.group('start'):
+                return match.group('start'), match.group('end')
+            single = single or match.group('single')
 
-        if match:
-            return match.group(1), match.group(2)
-
-        single_date_pattern = r'([A-Za-z]+ \d{4})'
-        match = re.search(single_date_pattern, text)
-
-        if match:
-            return match.group(1), None
-
-        return None, None
+        return single, None
 
     @staticmethod
     def parse_project_size(text: Optional[str]) -> Optional[str]:
@@ -188,8 +341,7 @@ class DataCleaner:
 
         text = text.strip()
 
-        money_pattern = r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?'
-        match = re.search(money_pattern, text)
+        match = _MONEY_RE.search(text)
 
         if match:
             return match.group(0)
@@ -209,6 +361,13 @@ def setup_logging(log_file: str = 'clutch_scraper.log', level: int = logging.INF
 
 
 def validate_url(url: str, base_domain: str = 'clutch.co') -> bool:
+    # Links the scraper builds take the fast path; anything unusual goes through urlparse
+    match = _HTTP_NETLOC_RE.match(url) if isinstance(url, str) else None
+    if match:
+        end = match.end()
+        if url[end:end + 1] in _NETLOC_TERMINATORS:
+            return base_domain in match.group(1)
+
     try:
         parsed = urlparse(url)
         return base_domain in parsed.netloc
@@ -216,11 +375,13 @@ def validate_url(url: str, base_domain: str = 'clutch.co') -> bool:
         return False
 
 
+# Listings cross-link the same profiles, so ids are cached per URL
+@lru_cache(maxsize=4096)
 def extract_company_id_from_url(url: str) -> Optional[str]:
     if not url:
         return None
 
-    match = re.search(r'/profile/([^/?]+)', url)
+    match = _PROFILE_ID_RE.search(url)
     if match:
         return match.group(1)
 
@@ -240,14 +401,19 @@ def parse_pagination_info(soup: BeautifulSoup) -> Dict[str, Any]:
     }
 
     try:
-        pagination = soup.find('nav', class_=lambda x: x and 'pagination' in x.lower())
+        pagination = soup.find('nav', class_=_PAGINATION_CLASS_RE)
 
         if pagination:
-            current = pagination.find('span', class_=lambda x: x and 'current' in x.lower())
+            current = pagination.find('span', class_=_CURRENT_CLASS_RE)
             if current:
                 pagination_info['current_page'] = int(current.get_text(strip=True))
 
-            next_link = pagination.find('a', string=lambda x: x and 'next' in x.lower())
+            # Check each link's own text directly rather than having bs4 filter every string
+            next_link = next(
+                (link for link in pagination.find_all('a')
+                 if link.string and _NEXT_TEXT_RE.search(link.string)),
+                None
+            )
             if next_link and next_link.get('href'):
                 pagination_info['has_next'] = True
                 pagination_info['next_url'] = urljoin('https://clutch.co', next_link['href'])